@@ -253,8 +253,10 @@ export const SunaProvider: React.FC<SunaProviderProps> = ({children}) => {
         // Add loading message
         const loadingId = addMessage('system', 'Suna is thinking...');
         
-        // Wait for response (simplified - in real app you'd want streaming)
-        setTimeout(async () => {
+        // The server runs the agent in the background; poll until the
+        // conversation is no longer pending, up to 90 seconds
+        const deadline = Date.now() + 90000;
+        const poll = async () => {
           try {
             const msgController = new AbortController();
             const msgTimeoutId = setTimeout(() => msgController.abort(), 10000);
@@ -269,16 +271,24 @@ export const SunaProvider: React.FC<SunaProviderProps> = ({children}) => {
             clearTimeout(msgTimeoutId);
             const messagesData = await messagesResponse.json();
             
+            if (messagesData.pending && Date.now() < deadline) {
+              setTimeout(poll, 1000);
+              return;
+            }
+            
             // Remove loading message and add response
             setMessages(prev => prev.filter(msg => msg.id !== loadingId.toString()));
             
             const lastMessage = messagesData.messages?.[messagesData.messages.length - 1];
             if (lastMessage && lastMessage.role === 'assistant') {
               addMessage('assistant', lastMessage.content);
+            } else if (lastMessage && lastMessage.role === 'error') {
+              addMessage('error', lastMessage.content);
             } else {
               addMessage('assistant', 'Response received from Suna.');
             }
           } catch (error) {
+            setMessages(prev => prev.filter(msg => msg.id !== loadingId.toString()));
             if (error.name === 'AbortError') {
               addMessage('error', 'Response timed out');
             } else {
@@ -287,7 +297,8 @@ export const SunaProvider: React.FC<SunaProviderProps> = ({children}) => {
           }
           
           setIsLoading(false);
-        }, 2000);
+        };
+        setTimeout(poll, 1000);
       } else {
         let errorData;
         try {
@@ -295,7 +306,12 @@ export const SunaProvider: React.FC<SunaProviderProps> = ({children}) => {
         } catch {
           errorData = { error: 'Server error' };
         }
-        addMessage('error', errorData.error || 'Failed to send message');
+        if (response.status === 409) {
+          // The previous message is still being processed
+          addMessage('system', errorData.error || 'Suna is still working on the previous message');
+        } else {
+          addMessage('error', errorData.error || 'Failed to send message');
+        }
         setIsLoading(false);
       }
     } catch (error) {
@@ -11,15 +11,93 @@ import shutil
 from pathlib import Path
 import json
 import argparse
+import asyncio
 import hashlib
+import importlib.util
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # Optional: native JSON encoder
+except ImportError:
+    orjson = None
+
+# Files smaller than this are copied with a plain buffered loop
+SMALL_COPY_THRESHOLD = 1024 * 1024
+
+_INSTALL_GUIDE = """# Suna Desktop Installation Guide
+
+## Windows Installation
+
+### Option 1: Installer (Recommended)
+1. Download `SunaDesktopSetup.exe`
+2. Run the installer as administrator
+3. Follow the setup wizard
+4. Launch from Start Menu or Desktop shortcut
+
+### Option 2: Portable
+1. Download `SunaDesktop_Portable.zip`
+2. Extract to any folder
+3. Run `SunaDesktop.exe`
+
+### Requirements
+- Windows 10 or later
+- Docker Desktop installed and running
+- 4GB RAM minimum, 8GB recommended
+
+## Android Installation
+
+1. Download `SunaDesktop-debug.apk`
+2. Enable "Install from unknown sources" in Android settings
+3. Install the APK file
+4. Configure your computer's IP address in Settings
+
+### Requirements
+- Android 7.0+ (API level 24+)
+- WiFi connection to same network as computer
+
+## First Time Setup
+
+1. **Install Docker Desktop** on your computer
+2. **Start Suna Desktop** application
+3. **Complete setup wizard** (API keys, database)
+4. **Start services** from Dashboard
+5. **Connect mobile app** using computer's IP address
+
+## Troubleshooting
+
+- **Windows**: Check Docker is running, ports 3000/5000/8000 available
+- **Android**: Verify IP address, check firewall settings
+- **Connection**: Ensure both devices on same WiFi network
+
+For detailed documentation, see README.md
+"""
+
+# Encoded once at import; written verbatim into every release package
+_INSTALL_GUIDE_BYTES = _INSTALL_GUIDE.encode('utf-8')
 
 class CompleteBuildSystem:
     """Complete build system for all Suna Desktop packages."""
     
-    def __init__(self):
+    def __init__(self, strict=False, use_cache=True):
         self.project_dir = Path.cwd()
+        # Strict mode actually runs toolchain binaries instead of only locating them
+        self.strict = strict
+        self.use_cache = use_cache
+        # Captured once so every artifact of this build shares one timestamp
+        self.build_timestamp = int(time.time())
         self.build_dir = self.project_dir / "build_output"
+        # Each build is assembled here and swapped into build_dir on success
+        self.staging_dir = self.project_dir / "build_output.new"
+        self.manifest_name = ".manifest.json"
+        
+        # Source (size, mtime) recorded for every artifact already in build_dir
+        self._copy_manifest = {}
+        
+        # Serializes console output from concurrently running build phases
+        self._print_lock = threading.Lock()
         
         # Security: Validate paths
         self._validate_paths()
@@ -41,41 +119,171 @@ class CompleteBuildSystem:
         
         if path.exists() and path.is_dir():
             shutil.rmtree(path)
+    
+    def _fast_copy(self, src, dst, preserve_stat=True, size=None):
+        """Copy a build artifact, picking the cheapest strategy for its size."""
+        if size is None:
+            size = os.stat(src).st_size
+        
+        copied = False
+        if size < SMALL_COPY_THRESHOLD:
+            # Below ~1 MiB the setup cost of the kernel fast paths outweighs
+            # their benefit; a plain buffered copy is quickest
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                shutil.copyfileobj(fsrc, fdst, length=64 * 1024)
+            copied = True
+        elif hasattr(os, 'copy_file_range'):
+            # copy_file_range lets CoW filesystems (btrfs/xfs) reflink or copy
+            # server-side without the data passing through userspace
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    remaining = size
+                    while remaining > 0:
+                        count = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if count == 0:
+                            break
+                        remaining -= count
+                copied = remaining == 0
+            except OSError:
+                copied = False
+        
+        if not copied:
+            # Dispatches to sendfile on Linux/macOS and CopyFile2 on Windows
+            shutil.copyfile(src, dst)
+        
+        if preserve_stat:
+            shutil.copystat(src, dst)
+        
+    def _load_copy_manifest(self):
+        """Load the artifact manifest written by the previous build."""
+        try:
+            manifest_path = self.build_dir / self.manifest_name
+            self._copy_manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self._copy_manifest = {}
+    
+    def _save_copy_manifest(self):
+        """Persist the artifact manifest for the next build."""
+        manifest_path = self.staging_dir / self.manifest_name
+        self._write_json(manifest_path, self._copy_manifest)
+    
+    def _write_json(self, path, data):
+        """Serialize data as indented JSON and write it in a single call."""
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode('utf-8')
+        path.write_bytes(payload)
+    
+    def _link_or_copy(self, src, dst, src_stat):
+        """Hard-link src to dst when both are on one filesystem, else copy it."""
+        try:
+            if src_stat.st_dev == os.stat(dst.parent).st_dev:
+                os.link(src, dst)
+                return
+        except OSError:
+            # EXDEV, missing link privilege on Windows, FAT volumes, ...
+            pass
+        self._fast_copy(src, dst, size=src_stat.st_size)
+    
+    def _copy_if_changed(self, src, dst, src_stat=None, link=False):
+        """Copy src into the staging tree, reusing the previous build's copy if unchanged.
+        
+        Missing sources are skipped, so callers need not check for them first.
+        With link=True the artifact may share an inode with src, so only pass
+        it for outputs nobody modifies in place.
+        """
+        if src_stat is None:
+            try:
+                src_stat = src.stat()
+            except FileNotFoundError:
+                return False
+        key = dst.relative_to(self.staging_dir).as_posix()
+        previous = self.build_dir / key
+        
+        # Compare against the recorded source stat rather than the previous
+        # copy's mtime so the check is immune to clock skew between filesystems
+        signature = [src_stat.st_size, src_stat.st_mtime_ns]
+        if self._copy_manifest.get(key) == signature and previous.exists():
+            # Carry the last-known-good artifact over without moving its data
+            try:
+                os.link(previous, dst)
+            except OSError:
+                self._fast_copy(previous, dst)
+            return False
+        
+        if link:
+            self._link_or_copy(src, dst, src_stat)
+        else:
+            self._fast_copy(src, dst, size=src_stat.st_size)
+        self._copy_manifest[key] = signature
+        return True
+    
+    def _copy_many(self, pairs, link=False):
+        """Copy several independent (src, dst) pairs concurrently."""
+        if not pairs:
+            return
+        workers = min(8, os.cpu_count() or 1, len(pairs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda pair: self._copy_if_changed(*pair, link=link), pairs))
+    
+    def _promote_staging(self):
+        """Atomically swap the staging tree in as the new build output."""
+        old_dir = self.project_dir / "build_output.old"
+        self._safe_remove_directory(old_dir)
+        
+        if self.build_dir.exists():
+            os.replace(self.build_dir, old_dir)
+        os.replace(self.staging_dir, self.build_dir)
         
+        # Deleting the previous tree does not need to hold up the summary
+        threading.Thread(
+            target=shutil.rmtree, args=(old_dir,), kwargs={'ignore_errors': True}
+        ).start()
+    
     def setup_build_environment(self):
         """Set up the build environment."""
         print("🔧 Setting up build environment...")
         
-        # Create build output directory
-        self._safe_remove_directory(self.build_dir)
-        self.build_dir.mkdir()
+        # Create a fresh staging directory; the previous build_output stays
+        # in place so unchanged artifacts can be reused from it
+        self._safe_remove_directory(self.staging_dir)
+        self.staging_dir.mkdir()
+        self._load_copy_manifest()
         
-        # Check Python dependencies
-        required_packages = [
-            'pyinstaller',
-            'pillow',  # For icon creation
-        ]
+        # Check Python dependencies (pip name -> import name)
+        required_packages = {
+            'pyinstaller': 'PyInstaller',
+            'pillow': 'PIL',  # For icon creation
+        }
         
-        for package in required_packages:
-            try:
-                # Security: Validate package name
-                clean_package = package.replace('-', '_')
-                if not clean_package.replace('_', '').isalnum():
-                    raise ValueError(f"Invalid package name: {package}")
-                
-                __import__(clean_package)
+        missing = []
+        for package, import_name in required_packages.items():
+            # Security: Validate package name
+            clean_package = package.replace('-', '_')
+            if not clean_package.replace('_', '').isalnum():
+                raise ValueError(f"Invalid package name: {package}")
+            
+            # Locate the module without executing it
+            if importlib.util.find_spec(import_name) is not None:
                 print(f"✅ {package} found")
-            except ImportError:
-                print(f"Installing {package}...")
-                try:
-                    subprocess.run([
-                        sys.executable, '-m', 'pip', 'install', package
-                    ], check=True, timeout=300)
-                    print(f"✅ {package} installed")
-                except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                    print(f"❌ Failed to install {package} automatically.")
-                    print(f"   Please install manually: python -m pip install {package}")
-                    return False
+            else:
+                missing.append(package)
+        
+        if missing:
+            # One pip process resolves and installs everything at once
+            print(f"Installing {', '.join(missing)}...")
+            try:
+                subprocess.run([
+                    sys.executable, '-m', 'pip', 'install',
+                    '--disable-pip-version-check', '--no-input', '--prefer-binary',
+                    *missing
+                ], check=True, timeout=600)
+                print(f"✅ {', '.join(missing)} installed")
+            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+                print(f"❌ Failed to install {', '.join(missing)} automatically.")
+                print(f"   Please install manually: python -m pip install {' '.join(missing)}")
+                return False
         
         print("✅ Build environment ready")
         return True
@@ -85,29 +293,31 @@ class CompleteBuildSystem:
         print("\n🪟 Building Windows packages...")
         
         try:
+            # Keep PyInstaller's cache in the project so analysis survives between builds
+            cache_dir = self.project_dir / ".pyi-cache"
+            cache_dir.mkdir(exist_ok=True)
+            os.environ.setdefault('PYINSTALLER_CONFIG_DIR', str(cache_dir))
+            
             from build_windows import WindowsBuilder
-            builder = WindowsBuilder()
+            builder = WindowsBuilder(project_dir=self.project_dir, use_cache=self.use_cache)
             success = builder.build_all()
             
             if success:
                 # Copy Windows builds to output directory
-                windows_dir = self.build_dir / "windows"
-                windows_dir.mkdir()
-                
-                # Copy executable
-                exe_path = self.project_dir / "dist" / "SunaDesktop.exe"
-                if exe_path.exists():
-                    shutil.copy2(exe_path, windows_dir / "SunaDesktop.exe")
-                
-                # Copy portable package
-                portable_path = self.project_dir / "SunaDesktop_Portable.zip"
-                if portable_path.exists():
-                    shutil.copy2(portable_path, windows_dir / "SunaDesktop_Portable.zip")
+                windows_dir = self.staging_dir / "windows"
+                windows_dir.mkdir(exist_ok=True)
                 
-                # Copy installer if it exists
-                installer_path = self.project_dir / "installer" / "SunaDesktopSetup.exe"
-                if installer_path.exists():
-                    shutil.copy2(installer_path, windows_dir / "SunaDesktopSetup.exe")
+                artifacts = [
+                    # Executable
+                    (self.project_dir / "dist" / "SunaDesktop.exe", windows_dir / "SunaDesktop.exe"),
+                    # Portable package
+                    (self.project_dir / "SunaDesktop_Portable.zip", windows_dir / "SunaDesktop_Portable.zip"),
+                    # Installer if it exists
+                    (self.project_dir / "installer" / "SunaDesktopSetup.exe", windows_dir / "SunaDesktopSetup.exe"),
+                ]
+                # build_windows deletes each of these before rebuilding it,
+                # so they are never edited in place and can be linked
+                self._copy_many(artifacts, link=True)
                 
                 print("✅ Windows packages built successfully")
                 return True
@@ -119,7 +329,20 @@ class CompleteBuildSystem:
             print(f"❌ Windows build error: {e}")
             return False
     
-    def build_android_app(self):
+    async def _run_command(self, args, cwd, timeout):
+        """Run a command without blocking the event loop; raise like subprocess.run(check=True)."""
+        process = await asyncio.create_subprocess_exec(*args, cwd=str(cwd))
+        try:
+            returncode = await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(args, timeout)
+        
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, args)
+    
+    async def build_android_app(self):
         """Build Android APK."""
         print("\n📱 Building Android app...")
         
@@ -129,20 +352,29 @@ class CompleteBuildSystem:
             return False
         
         try:
-            # Change to Android app directory
-            original_dir = os.getcwd()
-            os.chdir(android_dir)
-            
-            # Check if Node.js is available
-            try:
-                subprocess.run(['node', '--version'], check=True, capture_output=True)
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            # Check if Node.js and npm are available
+            node_path = shutil.which('node')
+            if node_path is None:
                 print("❌ Node.js not found. Please install Node.js 16+ from https://nodejs.org")
                 return False
+            # Resolved path also picks up npm.cmd on Windows
+            npm_path = shutil.which('npm')
+            if npm_path is None:
+                print("❌ npm not found. Please reinstall Node.js 16+ from https://nodejs.org")
+                return False
+            
+            if self.strict:
+                try:
+                    subprocess.run(
+                        [node_path, '--version'], check=True, cwd=android_dir,
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                    )
+                except (subprocess.CalledProcessError, FileNotFoundError):
+                    print(f"❌ Node.js at {node_path} failed to run")
+                    return False
             
             # Install dependencies
-            print("📦 Installing Node.js dependencies...")
-            subprocess.run(['npm', 'install'], check=True, timeout=600)
+            await self._install_node_dependencies(android_dir, npm_path)
             
             # Check if Android SDK is available
             android_home = os.environ.get('ANDROID_HOME') or os.environ.get('ANDROID_SDK_ROOT')
@@ -153,25 +385,33 @@ class CompleteBuildSystem:
             
             # Build debug APK
             print("🔨 Building Android APK...")
-            subprocess.run(['npm', 'run', 'build:android-debug'], check=True, timeout=1800)
+            await self._run_command([npm_path, 'run', 'build:android-debug'], cwd=android_dir, timeout=1800)
             
             # Copy APK to output directory
-            android_output_dir = self.build_dir / "android"
-            android_output_dir.mkdir()
+            android_output_dir = self.staging_dir / "android"
+            android_output_dir.mkdir(exist_ok=True)
             
             apk_path = android_dir / "android" / "app" / "build" / "outputs" / "apk" / "debug" / "app-debug.apk"
-            if apk_path.exists():
-                # Verify APK integrity
-                if self._verify_apk(apk_path):
-                    shutil.copy2(apk_path, android_output_dir / "SunaDesktop-debug.apk")
-                    print("✅ Android APK built successfully")
-                    return True
-                else:
-                    print("❌ APK verification failed")
-                    return False
-            else:
+            try:
+                apk_stat = apk_path.stat()
+            except FileNotFoundError:
                 print("❌ APK not found after build")
                 return False
+            
+            # Verify APK integrity
+            if self._verify_apk(apk_path, size=apk_stat.st_size):
+                # Copied, not linked: Gradle's incremental packaging can
+                # update app-debug.apk in place, which would rewrite the
+                # artifact in build_output through a shared inode
+                self._copy_if_changed(
+                    apk_path, android_output_dir / "SunaDesktop-debug.apk",
+                    src_stat=apk_stat
+                )
+                print("✅ Android APK built successfully")
+                return True
+            else:
+                print("❌ APK verification failed")
+                return False
                 
         except subprocess.TimeoutExpired:
             print("❌ Android build timed out")
@@ -182,51 +422,102 @@ class CompleteBuildSystem:
         except Exception as e:
             print(f"❌ Android build error: {e}")
             return False
-        finally:
-            os.chdir(original_dir)
     
-    def _verify_apk(self, apk_path):
+    async def _install_node_dependencies(self, android_dir, npm_path):
+        """Install npm dependencies, skipping the step when the lockfile is unchanged."""
+        lockfile = android_dir / "package-lock.json"
+        manifest = lockfile if lockfile.exists() else android_dir / "package.json"
+        cache_key = hashlib.sha256(manifest.read_bytes()).hexdigest()
+        
+        # Kept inside node_modules so deleting it also invalidates the key
+        key_file = android_dir / "node_modules" / ".suna_npm_cache_key"
+        try:
+            if key_file.read_text(encoding='utf-8').strip() == cache_key:
+                print("✅ Node.js dependencies up to date")
+                return
+        except OSError:
+            pass
+        
+        print("📦 Installing Node.js dependencies...")
+        # npm ci skips dependency resolution but requires a lockfile
+        command = 'ci' if manifest is lockfile else 'install'
+        await self._run_command(
+            [npm_path, command, '--prefer-offline', '--no-audit', '--no-fund'],
+            cwd=android_dir, timeout=600
+        )
+        key_file.write_text(cache_key, encoding='utf-8')
+    
+    def _sha256_file(self, path):
+        """Return the hex SHA-256 of a file, hashed entirely in C."""
+        # Unbuffered: readinto() fills our buffer directly, no stdio copy
+        with open(path, "rb", buffering=0) as f:
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            
+            # Python < 3.11: reuse one 1 MiB buffer instead of allocating a
+            # bytes object per chunk (mmap would fail on empty files)
+            sha256_hash = hashlib.sha256()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                sha256_hash.update(view[:n])
+            return sha256_hash.hexdigest()
+    
+    def _verify_apk(self, apk_path, size=None):
         """Verify APK integrity."""
         try:
             # Check file size (should be reasonable)
-            size = apk_path.stat().st_size
+            if size is None:
+                size = apk_path.stat().st_size
             if size < 1024 * 1024:  # Less than 1MB is suspicious
                 print(f"⚠️  APK size seems small: {size} bytes")
                 return False
             
             # Calculate hash for integrity
-            sha256_hash = hashlib.sha256()
-            with open(apk_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
+            digest = self._sha256_file(apk_path)
             
-            print(f"✅ APK hash: {sha256_hash.hexdigest()[:16]}...")
+            print(f"✅ APK hash: {digest[:16]}...")
             return True
             
         except Exception as e:
             print(f"❌ APK verification failed: {e}")
             return False
     
+    async def _run_build_phases(self, phases):
+        """Run build phases concurrently and map each name to its result or exception."""
+        loop = asyncio.get_running_loop()
+        tasks = []
+        for func in phases.values():
+            if asyncio.iscoroutinefunction(func):
+                tasks.append(func())
+            else:
+                # Synchronous phases (the Windows build) get a worker thread;
+                # off the main thread it runs PyInstaller as a subprocess
+                tasks.append(loop.run_in_executor(None, func))
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return dict(zip(phases, results))
+    
     def create_release_package(self):
         """Create a complete release package."""
         print("\n📦 Creating release package...")
         
-        release_dir = self.build_dir / "release"
-        release_dir.mkdir()
+        release_dir = self.staging_dir / "release"
+        release_dir.mkdir(exist_ok=True)
         
         # Copy documentation
         docs = ["README.md", "QUICK_START.md", "requirements.txt"]
-        for doc in docs:
-            doc_path = self.project_dir / doc
-            if doc_path.exists():
-                shutil.copy2(doc_path, release_dir / doc)
+        self._copy_many([(self.project_dir / doc, release_dir / doc) for doc in docs])
         
         # Create release info
         release_info = {
             "name": "Suna Desktop",
             "version": "1.0.0",
             "description": "Self-hosting AI Agent Platform",
-            "build_date": str(int(Path(__file__).stat().st_mtime)),
+            "build_date": str(self.build_timestamp),
             "components": {
                 "windows_executable": "windows/SunaDesktop.exe",
                 "windows_portable": "windows/SunaDesktop_Portable.zip",
@@ -243,60 +534,10 @@ class CompleteBuildSystem:
             }
         }
         
-        with open(release_dir / "release_info.json", 'w', encoding='utf-8') as f:
-            json.dump(release_info, f, indent=2)
+        self._write_json(release_dir / "release_info.json", release_info)
         
         # Create installation guide
-        install_guide = """# Suna Desktop Installation Guide
-
-## Windows Installation
-
-### Option 1: Installer (Recommended)
-1. Download `SunaDesktopSetup.exe`
-2. Run the installer as administrator
-3. Follow the setup wizard
-4. Launch from Start Menu or Desktop shortcut
-
-### Option 2: Portable
-1. Download `SunaDesktop_Portable.zip`
-2. Extract to any folder
-3. Run `SunaDesktop.exe`
-
-### Requirements
-- Windows 10 or later
-- Docker Desktop installed and running
-- 4GB RAM minimum, 8GB recommended
-
-## Android Installation
-
-1. Download `SunaDesktop-debug.apk`
-2. Enable "Install from unknown sources" in Android settings
-3. Install the APK file
-4. Configure your computer's IP address in Settings
-
-### Requirements
-- Android 7.0+ (API level 24+)
-- WiFi connection to same network as computer
-
-## First Time Setup
-
-1. **Install Docker Desktop** on your computer
-2. **Start Suna Desktop** application
-3. **Complete setup wizard** (API keys, database)
-4. **Start services** from Dashboard
-5. **Connect mobile app** using computer's IP address
-
-## Troubleshooting
-
-- **Windows**: Check Docker is running, ports 3000/5000/8000 available
-- **Android**: Verify IP address, check firewall settings
-- **Connection**: Ensure both devices on same WiFi network
-
-For detailed documentation, see README.md
-"""
-        
-        with open(release_dir / "INSTALLATION.md", 'w', encoding='utf-8') as f:
-            f.write(install_guide)
+        (release_dir / "INSTALLATION.md").write_bytes(_INSTALL_GUIDE_BYTES)
         
         print("✅ Release package created")
     
@@ -313,26 +554,47 @@ For detailed documentation, see README.md
             print("❌ Failed to setup build environment")
             return False
         
-        # Build Windows packages
+        # Windows and Android builds drive independent toolchains
+        # (PyInstaller vs npm/Gradle), so run them side by side.
+        phases = {}
         if not skip_windows:
-            if self.build_windows_packages():
-                success_count += 1
+            phases["windows"] = self.build_windows_packages
         else:
             print("\n⏭️  Skipping Windows build")
             total_builds -= 1
         
-        # Build Android app
         if not skip_android:
-            if self.build_android_app():
-                success_count += 1
+            phases["android"] = self.build_android_app
         else:
             print("\n⏭️  Skipping Android build")
             total_builds -= 1
         
+        if phases:
+            results = asyncio.run(self._run_build_phases(phases))
+            for name, result in results.items():
+                if isinstance(result, Exception):
+                    with self._print_lock:
+                        print(f"❌ {name.capitalize()} build error: {result}")
+                elif result:
+                    success_count += 1
+        
         # Create release package
         self.create_release_package()
+        self._save_copy_manifest()
+        
+        # Only replace the previous output when this run produced something;
+        # otherwise it stays intact and the staging tree is left for debugging
+        if success_count > 0:
+            self._promote_staging()
         
         # Summary
+        with self._print_lock:
+            self._print_summary(success_count, total_builds)
+        
+        return success_count == total_builds
+    
+    def _print_summary(self, success_count, total_builds):
+        """Print the build results and available packages."""
         print("\n" + "=" * 60)
         print("🎉 Build Process Complete!")
         print("=" * 60)
@@ -342,15 +604,13 @@ For detailed documentation, see README.md
             print(f"\n📁 Output directory: {self.build_dir}")
             print("\n📦 Available packages:")
             
-            windows_dir = self.build_dir / "windows"
-            if windows_dir.exists():
-                for file in windows_dir.iterdir():
-                    print(f"   🪟 {file.name}")
-            
-            android_dir = self.build_dir / "android"
-            if android_dir.exists():
-                for file in android_dir.iterdir():
-                    print(f"   📱 {file.name}")
+            for subdir, icon in (("windows", "🪟"), ("android", "📱")):
+                try:
+                    with os.scandir(self.build_dir / subdir) as entries:
+                        for entry in entries:
+                            print(f"   {icon} {entry.name}")
+                except FileNotFoundError:
+                    pass
             
             print(f"\n📋 Documentation: {self.build_dir / 'release'}")
         
@@ -359,19 +619,19 @@ For detailed documentation, see README.md
         print("- Windows packages may trigger antivirus warnings")
         print("- Android APK requires 'Unknown sources' enabled")
         print("- Users need Docker Desktop for Windows version")
-        
-        return success_count == total_builds
 
 def main():
     """Main build function with comprehensive error handling."""
     parser = argparse.ArgumentParser(description="Build all Suna Desktop packages")
     parser.add_argument('--skip-windows', action='store_true', help="Skip Windows build")
     parser.add_argument('--skip-android', action='store_true', help="Skip Android build")
+    parser.add_argument('--strict', action='store_true', help="Verify toolchain binaries actually run")
+    parser.add_argument('--no-cache', action='store_true', help="Ignore and don't update cached Windows build outputs")
     
     args = parser.parse_args()
     
     try:
-        builder = CompleteBuildSystem()
+        builder = CompleteBuildSystem(strict=args.strict, use_cache=not args.no_cache)
         success = builder.build_all(
             skip_windows=args.skip_windows,
             skip_android=args.skip_android
@@ -6,13 +6,18 @@ Simple script to launch Suna Desktop with automatic setup if needed.
 
 import os
 import sys
-import json
-from pathlib import Path
+
+# Written by setup_suna_desktop.py into the working directory
+CONFIG_FILE = "suna_desktop_config.json"
+
+# A frozen build must not try to write .pyc files next to its temporary
+# extraction directory
+if getattr(sys, 'frozen', False):
+    sys.dont_write_bytecode = True
 
 def check_setup():
     """Check if Suna Desktop has been set up."""
-    config_file = Path("suna_desktop_config.json")
-    return config_file.exists()
+    return os.path.isfile(CONFIG_FILE)
 
 def run_setup():
     """Run the setup process."""
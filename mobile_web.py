@@ -4,294 +4,46 @@ Mobile Web Interface for Suna Desktop
 A simple web server providing mobile access to Suna functionality.
 """
 
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, Response, request, jsonify, session
+from flask.json.provider import JSONProvider
 import requests
 import json
-import os
 import uuid
-from datetime import datetime
 import threading
+import collections
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 import time
-import re
 import secrets
-from urllib.parse import urlparse
+import gzip
 
-class SunaMobileWeb:
-    """Mobile web interface for Suna."""
-    
-    def __init__(self, host='0.0.0.0', port=5000, suna_api_url='http://localhost:8000'):
-        self.app = Flask(__name__)
-        # Security: Use cryptographically secure random key
-        self.app.secret_key = secrets.token_bytes(32)
-        self.host = host
-        self.port = port
-        self.suna_api_url = suna_api_url
-        
-        # Active conversations
-        self.conversations = {}
-        
-        # Security: Input validation patterns
-        self.uuid_pattern = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
-        
-        self.setup_routes()
-        
-    def _validate_uuid(self, uuid_string):
-        """Validate UUID format for security."""
-        if not isinstance(uuid_string, str):
-            return False
-        return bool(self.uuid_pattern.match(uuid_string.lower()))
-    
-    def _validate_message(self, message):
-        """Validate message content."""
-        if not isinstance(message, str):
-            return False, "Message must be a string"
-        
-        message = message.strip()
-        if not message:
-            return False, "Message cannot be empty"
-        
-        if len(message) > 10000:
-            return False, "Message too long (max 10,000 characters)"
-        
-        return True, message
-    
-    def _safe_request_to_suna(self, endpoint, method='GET', data=None, timeout=30):
-        """Make a safe request to Suna API with validation."""
-        try:
-            # Validate endpoint
-            if not endpoint.startswith('/'):
-                endpoint = '/' + endpoint
-            
-            url = self.suna_api_url + endpoint
-            parsed_url = urlparse(url)
-            
-            # Security: Ensure we're only making requests to the configured Suna API
-            if parsed_url.hostname not in ['localhost', '127.0.0.1']:
-                expected_host = urlparse(self.suna_api_url).hostname
-                if parsed_url.hostname != expected_host:
-                    raise ValueError("Invalid API endpoint")
-            
-            headers = {
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                'User-Agent': 'SunaMobileWeb/1.0'
-            }
-            
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, timeout=timeout)
-            elif method.upper() == 'POST':
-                response = requests.post(url, headers=headers, json=data, timeout=timeout)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            return response
-            
-        except requests.exceptions.Timeout:
-            raise Exception("Request to Suna API timed out")
-        except requests.exceptions.ConnectionError:
-            raise Exception("Could not connect to Suna API")
-        except Exception as e:
-            raise Exception(f"API request failed: {str(e)}")
-    
-    def setup_routes(self):
-        """Set up Flask routes."""
-        
-        @self.app.route('/')
-        def index():
-            """Main mobile interface."""
-            return render_template('mobile_index.html')
-        
-        @self.app.route('/api/health')
-        def health():
-            """Health check for the mobile interface."""
-            return jsonify({"status": "ok", "timestamp": datetime.now().isoformat()})
-        
-        @self.app.route('/api/suna/health')
-        def suna_health():
-            """Check Suna backend health."""
-            try:
-                response = self._safe_request_to_suna('/api/health', timeout=5)
-                return jsonify({
-                    "status": "connected" if response.status_code == 200 else "disconnected",
-                    "suna_response": response.json() if response.status_code == 200 else None
-                })
-            except Exception as e:
-                return jsonify({"status": "disconnected", "suna_response": None})
-        
-        @self.app.route('/api/chat/new', methods=['POST'])
-        def new_chat():
-            """Start a new chat conversation."""
-            chat_id = str(uuid.uuid4())
-            self.conversations[chat_id] = {
-                "id": chat_id,
-                "created_at": datetime.now().isoformat(),
-                "messages": [],
-                "thread_id": None,
-                "agent_run_id": None
-            }
-            session['current_chat'] = chat_id
-            return jsonify({"chat_id": chat_id, "status": "created"})
-        
-        @self.app.route('/api/chat/<chat_id>/messages')
-        def get_messages(chat_id):
-            """Get messages for a chat."""
-            # Security: Validate chat_id
-            if not self._validate_uuid(chat_id):
-                return jsonify({"error": "Invalid chat ID"}), 400
-            
-            if chat_id in self.conversations:
-                return jsonify({"messages": self.conversations[chat_id]["messages"]})
-            return jsonify({"error": "Chat not found"}), 404
-        
-        @self.app.route('/api/chat/<chat_id>/send', methods=['POST'])
-        def send_message(chat_id):
-            """Send a message in a chat."""
-            # Security: Validate chat_id
-            if not self._validate_uuid(chat_id):
-                return jsonify({"error": "Invalid chat ID"}), 400
-            
-            if chat_id not in self.conversations:
-                return jsonify({"error": "Chat not found"}), 404
-            
-            try:
-                data = request.get_json()
-                if not data:
-                    return jsonify({"error": "No JSON data provided"}), 400
-            except Exception:
-                return jsonify({"error": "Invalid JSON data"}), 400
-            
-            # Validate message
-            raw_message = data.get('message', '')
-            is_valid, message = self._validate_message(raw_message)
-            if not is_valid:
-                return jsonify({"error": message}), 400
-            
-            # Add user message to conversation
-            user_msg = {
-                "id": str(uuid.uuid4()),
-                "role": "user",
-                "content": message,
-                "timestamp": datetime.now().isoformat()
-            }
-            self.conversations[chat_id]["messages"].append(user_msg)
-            
-            # Process message with Suna
-            try:
-                result = self._process_with_suna(chat_id, message)
-                return jsonify(result)
-            except Exception as e:
-                error_msg = {
-                    "id": str(uuid.uuid4()),
-                    "role": "error",
-                    "content": f"Error: {str(e)}",
-                    "timestamp": datetime.now().isoformat()
-                }
-                self.conversations[chat_id]["messages"].append(error_msg)
-                return jsonify({"error": str(e)}), 500
-        
-        @self.app.route('/api/conversations')
-        def list_conversations():
-            """List all conversations."""
-            conv_list = []
-            for conv_id, conv in self.conversations.items():
-                conv_summary = {
-                    "id": conv_id,
-                    "created_at": conv["created_at"],
-                    "message_count": len(conv["messages"]),
-                    "last_message": conv["messages"][-1]["content"][:50] + "..." if conv["messages"] else "No messages"
-                }
-                conv_list.append(conv_summary)
-            
-            # Sort by creation time, newest first
-            conv_list.sort(key=lambda x: x["created_at"], reverse=True)
-            return jsonify({"conversations": conv_list})
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for jsonify() and get_json()."""
     
-    def _process_with_suna(self, chat_id, message):
-        """Process message with Suna backend."""
-        conversation = self.conversations[chat_id]
-        
-        # If this is the first message, initiate agent
-        if not conversation["thread_id"]:
-            response = self._safe_request_to_suna(
-                '/api/agent/initiate',
-                method='POST',
-                data={
-                    'prompt': message,
-                    'model_name': 'claude-3-5-sonnet-20241022',
-                    'enable_thinking': 'false',
-                    'reasoning_effort': 'low',
-                    'stream': 'false',  # No streaming for mobile
-                    'enable_context_manager': 'false'
-                }
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                conversation["thread_id"] = result.get("thread_id")
-                conversation["agent_run_id"] = result.get("agent_run_id")
-                
-                # Add system message
-                system_msg = {
-                    "id": str(uuid.uuid4()),
-                    "role": "system",
-                    "content": f"Conversation started (Thread: {conversation['thread_id'][:8]}...)",
-                    "timestamp": datetime.now().isoformat()
-                }
-                conversation["messages"].append(system_msg)
-                
-                # Wait for response and add it
-                response_text = self._wait_for_response(conversation["agent_run_id"])
-                if response_text:
-                    assistant_msg = {
-                        "id": str(uuid.uuid4()),
-                        "role": "assistant",
-                        "content": response_text,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    conversation["messages"].append(assistant_msg)
-                
-                return {"status": "success", "thread_id": conversation["thread_id"]}
-            else:
-                raise Exception(f"Failed to initiate agent: {response.status_code}")
-        
-        return {"status": "success"}
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
     
-    def _wait_for_response(self, agent_run_id, timeout=60):
-        """Wait for agent response (simplified for mobile)."""
-        # Security: Validate agent_run_id
-        if not self._validate_uuid(agent_run_id):
-            return "Invalid agent run ID"
-        
-        # This is a simplified implementation
-        # In a real application, you'd want to implement proper streaming or polling
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            try:
-                # Check agent run status
-                response = self._safe_request_to_suna(f'/api/agent-run/{agent_run_id}')
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("status") == "completed":
-                        # Try to get the response (this would need to be implemented in Suna API)
-                        return "Response received from Suna agent"
-                    elif data.get("status") == "failed":
-                        return f"Agent failed: {data.get('error', 'Unknown error')}"
-                
-                time.sleep(2)  # Poll every 2 seconds
-            except Exception as e:
-                print(f"Error checking agent status: {e}")
-                time.sleep(2)
-        
-        return "Response timeout"
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
     
-    def create_templates(self):
-        """Create HTML templates for the mobile interface."""
-        templates_dir = "templates"
-        os.makedirs(templates_dir, exist_ok=True)
-        
-        # Mobile index template
-        mobile_html = """<!DOCTYPE html>
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, no str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+# The page has no template variables, so it is served as-is instead of
+# being written to disk and rendered through Jinja
+MOBILE_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -594,12 +346,18 @@ class SunaMobileWeb:
                     // Add loading indicator
                     const loadingId = addMessage('system', '<span class="loading"></span> Suna is thinking...');
                     
-                    // Wait a bit then try to get the response
-                    setTimeout(async () => {
+                    // Poll until the server has finished with the agent run
+                    const deadline = Date.now() + 90000;
+                    const poll = async () => {
                         try {
                             const messagesResponse = await fetch(`/api/chat/${currentChatId}/messages`);
                             const messagesData = await messagesResponse.json();
                             
+                            if (messagesData.pending && Date.now() < deadline) {
+                                setTimeout(poll, 1000);
+                                return;
+                            }
+                            
                             // Remove loading message
                             removeMessage(loadingId);
                             
@@ -609,6 +367,8 @@ class SunaMobileWeb:
                             
                             if (lastMessage && lastMessage.role === 'assistant') {
                                 addMessage('assistant', lastMessage.content);
+                            } else if (lastMessage && lastMessage.role === 'error') {
+                                addMessage('error', lastMessage.content);
                             } else {
                                 addMessage('assistant', 'Response received from Suna.');
                             }
@@ -618,7 +378,8 @@ class SunaMobileWeb:
                         }
                         
                         setLoading(false);
-                    }, 2000);
+                    };
+                    setTimeout(poll, 1000);
                 } else {
                     const errorData = await response.json();
                     addMessage('error', errorData.error || 'Failed to send message');
@@ -683,15 +444,398 @@ class SunaMobileWeb:
     </script>
 </body>
 </html>"""
+
+# Compressed once at import; the page never changes at runtime
+_MOBILE_HTML_BYTES = MOBILE_HTML.encode('utf-8')
+_MOBILE_HTML_GZ = gzip.compress(_MOBILE_HTML_BYTES, compresslevel=9, mtime=0)
+_MOBILE_HTML_BR = brotli.compress(_MOBILE_HTML_BYTES, quality=11) if brotli else None
+
+class SunaMobileWeb:
+    """Mobile web interface for Suna."""
+    
+    def __init__(self, host='0.0.0.0', port=5000, suna_api_url='http://localhost:8000'):
+        self.app = Flask(__name__)
+        # Security: Use cryptographically secure random key
+        self.app.secret_key = secrets.token_bytes(32)
+        if orjson is not None:
+            self.app.json = OrjsonProvider(self.app)
+        self.host = host
+        self.port = port
+        self.suna_api_url = suna_api_url
+        self._suna_api_headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'User-Agent': 'SunaMobileWeb/1.0'
+        }
+        
+        # One keep-alive session per request thread, so repeated calls to
+        # the backend (e.g. status polling) reuse their connection
+        self._thread_local = threading.local()
+        
+        # Agent runs are awaited off the request threads, so a slow agent
+        # doesn't tie up the web server for up to a minute per message
+        self._agent_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='suna-agent')
+        
+        # Active conversations, least recently used first and capped at
+        # _max_conversations. Flask serves requests on several threads:
+        # _conv_lock guards the mapping itself and each conversation's own
+        # "lock" guards its message list.
+        self.conversations = collections.OrderedDict()
+        self._conv_lock = threading.RLock()
+        self._max_conversations = 1000
+        
+        # Message ids only need to be unique within this process, so a
+        # random per-process prefix plus a counter replaces uuid4 per message
+        self._msg_prefix = secrets.token_hex(4)
+        self._msg_counter = itertools.count()
+        
+        # Every open page polls the backend health; answer repeats from a
+        # short-lived cache so many clients cost one upstream request
+        self._health_cache = (0.0, None)
+        self._health_lock = threading.Lock()
+        self._health_ttl = 2.0
+        
+        self.setup_routes()
+        
+    def _validate_uuid(self, uuid_string):
+        """Validate UUID format for security."""
+        if not isinstance(uuid_string, str) or len(uuid_string) != 36:
+            return False
+        # uuid.UUID also accepts braces, URNs, bare hex and digit
+        # separators, so require the parse to round-trip to the input
+        try:
+            return str(uuid.UUID(uuid_string)) == uuid_string.lower()
+        except ValueError:
+            return False
+    
+    def _get_conversation(self, chat_id):
+        """Look up a conversation and mark it recently used, or None if it doesn't exist."""
+        with self._conv_lock:
+            conversation = self.conversations.get(chat_id)
+            if conversation is not None:
+                self.conversations.move_to_end(chat_id)
+            return conversation
+    
+    def _next_message_id(self):
+        """Return a new process-unique message id."""
+        return f"{self._msg_prefix}-{next(self._msg_counter)}"
+    
+    def _append_message(self, conversation, message):
+        """Append a message to a conversation and refresh its list summary."""
+        summary = message["content"][:50] + "..."
+        with conversation["lock"]:
+            conversation["messages"].append(message)
+            conversation["last_message"] = summary
+    
+    def _validate_message(self, message):
+        """Validate message content."""
+        if not isinstance(message, str):
+            return False, "Message must be a string"
+        
+        message = message.strip()
+        if not message:
+            return False, "Message cannot be empty"
+        
+        if len(message) > 10000:
+            return False, "Message too long (max 10,000 characters)"
+        
+        return True, message
+    
+    def _get_session(self):
+        """Return this thread's pooled HTTP session to the Suna API."""
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._thread_local.session = session
+        return session
+    
+    def _safe_request_to_suna(self, endpoint, method='GET', data=None, timeout=30):
+        """Make a safe request to Suna API with validation."""
+        try:
+            # Validate endpoint
+            if not endpoint.startswith('/'):
+                endpoint = '/' + endpoint
+            
+            # Security: the scheme and host come from the configured
+            # suna_api_url, and an endpoint starting with '/' can only
+            # extend its path, so requests never leave the Suna API
+            url = self.suna_api_url + endpoint
+            
+            method = method.upper()
+            if method == 'GET':
+                response = self._get_session().get(url, headers=self._suna_api_headers, timeout=timeout)
+            elif method == 'POST':
+                response = self._get_session().post(url, headers=self._suna_api_headers, json=data, timeout=timeout)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            return response
+            
+        except requests.exceptions.Timeout:
+            raise Exception("Request to Suna API timed out")
+        except requests.exceptions.ConnectionError:
+            raise Exception("Could not connect to Suna API")
+        except Exception as e:
+            raise Exception(f"API request failed: {str(e)}")
+    
+    def _get_suna_health(self):
+        """Return the backend health payload, cached for a couple of seconds."""
+        with self._health_lock:
+            checked_at, payload = self._health_cache
+            if payload is not None and time.monotonic() - checked_at < self._health_ttl:
+                return payload
+            
+            try:
+                response = self._safe_request_to_suna('/api/health', timeout=5)
+                payload = {
+                    "status": "connected" if response.status_code == 200 else "disconnected",
+                    "suna_response": response.json() if response.status_code == 200 else None
+                }
+            except Exception as e:
+                payload = {"status": "disconnected", "suna_response": None}
+            
+            self._health_cache = (time.monotonic(), payload)
+            return payload
+    
+    def setup_routes(self):
+        """Set up Flask routes."""
+        
+        @self.app.route('/')
+        def index():
+            """Main mobile interface."""
+            accepted = request.accept_encodings
+            if _MOBILE_HTML_BR is not None and accepted['br']:
+                body, encoding = _MOBILE_HTML_BR, 'br'
+            elif accepted['gzip']:
+                body, encoding = _MOBILE_HTML_GZ, 'gzip'
+            else:
+                body, encoding = _MOBILE_HTML_BYTES, None
+            
+            response = Response(body, mimetype='text/html')
+            if encoding:
+                response.headers['Content-Encoding'] = encoding
+            response.vary.add('Accept-Encoding')
+            return response
+        
+        @self.app.route('/api/health')
+        def health():
+            """Health check for the mobile interface."""
+            return jsonify({"status": "ok", "timestamp": time.time()})
+        
+        @self.app.route('/api/suna/health')
+        def suna_health():
+            """Check Suna backend health."""
+            return jsonify(self._get_suna_health())
+        
+        @self.app.route('/api/chat/new', methods=['POST'])
+        def new_chat():
+            """Start a new chat conversation."""
+            chat_id = str(uuid.uuid4())
+            conversation = {
+                "id": chat_id,
+                "created_at": time.time(),
+                "messages": [],
+                "thread_id": None,
+                "agent_run_id": None,
+                "pending": False,
+                "last_message": "No messages",
+                "lock": threading.Lock()
+            }
+            with self._conv_lock:
+                self.conversations[chat_id] = conversation
+                # Drop the least recently used conversations past the cap
+                while len(self.conversations) > self._max_conversations:
+                    self.conversations.popitem(last=False)
+            session['current_chat'] = chat_id
+            return jsonify({"chat_id": chat_id, "status": "created"})
+        
+        @self.app.route('/api/chat/<chat_id>/messages')
+        def get_messages(chat_id):
+            """Get messages for a chat."""
+            # Security: only ids minted by new_chat are ever stored, so the
+            # lookup itself rejects anything malformed
+            conversation = self._get_conversation(chat_id)
+            if conversation is None:
+                return jsonify({"error": "Chat not found"}), 404
+            
+            with conversation["lock"]:
+                messages = list(conversation["messages"])
+                pending = conversation["pending"]
+            return jsonify({"messages": messages, "pending": pending})
+        
+        @self.app.route('/api/chat/<chat_id>/send', methods=['POST'])
+        def send_message(chat_id):
+            """Send a message in a chat."""
+            # Security: only ids minted by new_chat are ever stored, so the
+            # lookup itself rejects anything malformed
+            conversation = self._get_conversation(chat_id)
+            if conversation is None:
+                return jsonify({"error": "Chat not found"}), 404
+            
+            try:
+                data = request.get_json()
+                if not data:
+                    return jsonify({"error": "No JSON data provided"}), 400
+            except Exception:
+                return jsonify({"error": "Invalid JSON data"}), 400
+            
+            # Validate message
+            raw_message = data.get('message', '')
+            is_valid, message = self._validate_message(raw_message)
+            if not is_valid:
+                return jsonify({"error": message}), 400
+            
+            # One agent run per conversation at a time
+            with conversation["lock"]:
+                if conversation["pending"]:
+                    return jsonify({"error": "Suna is still working on the previous message"}), 409
+                conversation["pending"] = True
+            
+            # Add user message to conversation
+            user_msg = {
+                "id": self._next_message_id(),
+                "role": "user",
+                "content": message,
+                "timestamp": time.time()
+            }
+            self._append_message(conversation, user_msg)
+            
+            # Process message with Suna in the background; the client polls
+            # the messages endpoint until "pending" clears
+            self._agent_executor.submit(self._process_in_background, conversation, message)
+            return jsonify({"status": "processing"}), 202
         
-        with open(os.path.join(templates_dir, 'mobile_index.html'), 'w') as f:
-            f.write(mobile_html)
+        @self.app.route('/api/conversations')
+        def list_conversations():
+            """List all conversations, most recently used first."""
+            # Snapshot under the lock, summarize outside it
+            with self._conv_lock:
+                items = list(self.conversations.items())
+            
+            # The mapping is kept in LRU order, so most recently used first
+            # is simply the reverse
+            conv_list = []
+            for conv_id, conv in reversed(items):
+                with conv["lock"]:
+                    conv_summary = {
+                        "id": conv_id,
+                        "created_at": conv["created_at"],
+                        "message_count": len(conv["messages"]),
+                        "last_message": conv["last_message"]
+                    }
+                conv_list.append(conv_summary)
+            
+            return jsonify({"conversations": conv_list})
+    
+    def _process_in_background(self, conversation, message):
+        """Run _process_with_suna off the request thread, recording failures as messages."""
+        try:
+            self._process_with_suna(conversation, message)
+        except Exception as e:
+            error_msg = {
+                "id": self._next_message_id(),
+                "role": "error",
+                "content": f"Error: {str(e)}",
+                "timestamp": time.time()
+            }
+            self._append_message(conversation, error_msg)
+        finally:
+            with conversation["lock"]:
+                conversation["pending"] = False
+    
+    def _process_with_suna(self, conversation, message):
+        """Process message with Suna backend."""
+        
+        # If this is the first message, initiate agent
+        if not conversation["thread_id"]:
+            response = self._safe_request_to_suna(
+                '/api/agent/initiate',
+                method='POST',
+                data={
+                    'prompt': message,
+                    'model_name': 'claude-3-5-sonnet-20241022',
+                    'enable_thinking': 'false',
+                    'reasoning_effort': 'low',
+                    'stream': 'false',  # No streaming for mobile
+                    'enable_context_manager': 'false'
+                }
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                conversation["thread_id"] = result.get("thread_id")
+                conversation["agent_run_id"] = result.get("agent_run_id")
+                
+                # Add system message
+                system_msg = {
+                    "id": self._next_message_id(),
+                    "role": "system",
+                    "content": f"Conversation started (Thread: {conversation['thread_id'][:8]}...)",
+                    "timestamp": time.time()
+                }
+                self._append_message(conversation, system_msg)
+                
+                # Wait for response and add it
+                response_text = self._wait_for_response(conversation["agent_run_id"])
+                if response_text:
+                    assistant_msg = {
+                        "id": self._next_message_id(),
+                        "role": "assistant",
+                        "content": response_text,
+                        "timestamp": time.time()
+                    }
+                    self._append_message(conversation, assistant_msg)
+                
+                return {"status": "success", "thread_id": conversation["thread_id"]}
+            else:
+                raise Exception(f"Failed to initiate agent: {response.status_code}")
+        
+        return {"status": "success"}
+    
+    def _wait_for_response(self, agent_run_id, timeout=60):
+        """Wait for agent response (simplified for mobile)."""
+        # Security: Validate agent_run_id
+        if not self._validate_uuid(agent_run_id):
+            return "Invalid agent run ID"
+        
+        # This is a simplified implementation
+        # In a real application, you'd want to implement proper streaming or polling
+        start_time = time.time()
+        
+        while time.time() - start_time < timeout:
+            try:
+                # Check agent run status
+                response = self._safe_request_to_suna(f'/api/agent-run/{agent_run_id}')
+                if response.status_code == 200:
+                    data = response.json()
+                    if data.get("status") == "completed":
+                        # Try to get the response (this would need to be implemented in Suna API)
+                        return "Response received from Suna agent"
+                    elif data.get("status") == "failed":
+                        return f"Agent failed: {data.get('error', 'Unknown error')}"
+                
+                time.sleep(2)  # Poll every 2 seconds
+            except Exception as e:
+                print(f"Error checking agent status: {e}")
+                time.sleep(2)
+        
+        return "Response timeout"
     
     def run(self):
         """Run the mobile web server."""
-        self.create_templates()
         print(f"Starting Suna Mobile Web Interface on http://{self.host}:{self.port}")
         
+        # Prefer a production WSGI server; Werkzeug's development server
+        # parses and dispatches every request far more slowly
+        try:
+            from waitress import serve
+        except ImportError:
+            serve = None
+        
+        if serve is not None:
+            serve(self.app, host=self.host, port=self.port, threads=8, ident='SunaMobileWeb')
+            return
+        
         # Security: Disable debug mode in production
         self.app.run(
             host=self.host, 
@@ -4,16 +4,134 @@ Suna Desktop Setup Script
 Automated installation and configuration for Suna Desktop Application.
 """
 
-import os
 import sys
 import subprocess
 import shutil
 import json
 import argparse
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import requests
-import zipfile
-import tempfile
+import io
+
+# Read size for streaming downloads; small chunks leave the transfer
+# dominated by per-chunk Python overhead
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Files written by setup_suna_environment(); existing files are left alone
+BACKEND_ENV_TEMPLATE = """# Suna Backend Configuration
+# Generated by Suna Desktop Setup
+
+# Redis Configuration
+REDIS_HOST=redis
+REDIS_PORT=6379
+REDIS_PASSWORD=
+REDIS_SSL=False
+
+# RabbitMQ Configuration
+RABBITMQ_HOST=rabbitmq
+RABBITMQ_PORT=5672
+
+# LLM Configuration
+# Add your API keys here:
+ANTHROPIC_API_KEY=
+OPENAI_API_KEY=
+OPENROUTER_API_KEY=
+
+# Database Configuration
+# For local setup, you can use Supabase cloud or local instance
+SUPABASE_URL=
+SUPABASE_KEY=
+SUPABASE_SERVICE_ROLE_KEY=
+
+# Search and Web Scraping (Optional)
+TAVILY_API_KEY=
+FIRECRAWL_API_KEY=
+
+# Background Jobs
+QSTASH_URL=
+QSTASH_TOKEN=
+
+# Daytona Configuration (for agent execution)
+DAYTONA_SERVER_URL=
+DAYTONA_API_KEY=
+"""
+
+FRONTEND_ENV_TEMPLATE = """# Suna Frontend Configuration
+# Generated by Suna Desktop Setup
+
+NEXT_PUBLIC_BACKEND_URL=http://localhost:8000
+NEXT_PUBLIC_FRONTEND_URL=http://localhost:3000
+"""
+
+# Files written by create_launcher_scripts()
+LAUNCHER_SCRIPT = """#!/usr/bin/env python3
+\"\"\"
+Suna Desktop Launcher
+Quick launcher for the Suna Desktop application.
+\"\"\"
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+def main():
+    try:
+        from suna_desktop import main as suna_main
+        suna_main()
+    except ImportError as e:
+        print(f"Error importing Suna Desktop: {e}")
+        print("Please ensure all dependencies are installed:")
+        print("pip install -r requirements.txt")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\\nSuna Desktop application closed.")
+    except Exception as e:
+        print(f"Error running Suna Desktop: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
+"""
+
+WINDOWS_LAUNCHER_TEMPLATE = """@echo off
+echo Starting Suna Desktop...
+python "{launcher_path}"
+pause
+"""
+
+SHELL_LAUNCHER_TEMPLATE = """#!/bin/bash
+echo "Starting Suna Desktop..."
+python3 "{launcher_path}"
+"""
+
+@functools.lru_cache(maxsize=None)
+def _probe_tool_version(*command):
+    """Return a tool's version output, or None if it is unavailable.
+    
+    Results are cached for the life of the process: CLI probes such as
+    `docker --version` can take a second or more each.
+    """
+    # Skip the fork entirely when the executable isn't on PATH
+    if shutil.which(command[0]) is None:
+        return None
+    try:
+        result = subprocess.run(list(command), capture_output=True, text=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return result.stdout.strip()
+
+def _probe_compose_version():
+    """Return the Docker Compose version, preferring the `docker compose` plugin."""
+    # The plugin is a Go binary and answers quickly; the legacy
+    # docker-compose wrapper may have to start a Python interpreter first
+    return (_probe_tool_version('docker', 'compose', 'version')
+            or _probe_tool_version('docker-compose', '--version'))
 
 class SunaDesktopSetup:
     """Setup and installation manager for Suna Desktop."""
@@ -23,6 +141,12 @@ class SunaDesktopSetup:
         self.suna_dir = self.current_dir / "suna"
         self.setup_complete = False
         
+        # The platform can't change while setup runs, so pick the
+        # platform-specific launcher once
+        self._is_windows = sys.platform == "win32"
+        self._write_platform_launcher = (self._write_batch_launcher if self._is_windows
+                                         else self._write_shell_launcher)
+        
     def check_python_version(self):
         """Check if Python version is compatible."""
         if sys.version_info < (3, 8):
@@ -39,33 +163,35 @@ class SunaDesktopSetup:
         if not self.check_python_version():
             return False
         
+        # The probes are independent, so run them side by side and report
+        # the results in the usual order
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            docker_future = executor.submit(_probe_tool_version, 'docker', '--version')
+            compose_future = executor.submit(_probe_compose_version)
+            git_future = executor.submit(_probe_tool_version, 'git', '--version')
+            docker_version = docker_future.result()
+            compose_version = compose_future.result()
+            git_version = git_future.result()
+        
         # Check Docker
-        try:
-            result = subprocess.run(['docker', '--version'], 
-                                  capture_output=True, text=True, check=True)
-            print(f"✅ Docker detected: {result.stdout.strip()}")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if docker_version is None:
             print("❌ Docker is not installed or not available")
             print("   Please install Docker from: https://docs.docker.com/get-docker/")
             return False
+        print(f"✅ Docker detected: {docker_version}")
         
         # Check Docker Compose
-        try:
-            result = subprocess.run(['docker-compose', '--version'], 
-                                  capture_output=True, text=True, check=True)
-            print(f"✅ Docker Compose detected: {result.stdout.strip()}")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if compose_version is None:
             print("❌ Docker Compose is not installed or not available")
             print("   Please install Docker Compose from: https://docs.docker.com/compose/install/")
             return False
+        print(f"✅ Docker Compose detected: {compose_version}")
         
         # Check Git
-        try:
-            result = subprocess.run(['git', '--version'], 
-                                  capture_output=True, text=True, check=True)
-            print(f"✅ Git detected: {result.stdout.strip()}")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if git_version is None:
             print("⚠️  Git is not installed - using alternative download method")
+        else:
+            print(f"✅ Git detected: {git_version}")
         
         return True
     
@@ -74,8 +200,14 @@ class SunaDesktopSetup:
         print("\n📦 Installing Python dependencies...")
         
         try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'], 
-                          check=True)
+            # Prefer wheels so pip doesn't fall back to building sdists. Quiet
+            # output keeps slow consoles (notably cmd.exe) off the critical
+            # path while errors are still shown.
+            subprocess.run([
+                sys.executable, '-m', 'pip', 'install', '--quiet',
+                '--disable-pip-version-check', '--no-input', '--prefer-binary',
+                '-r', 'requirements.txt'
+            ], check=True)
             print("✅ Python dependencies installed successfully")
             return True
         except subprocess.CalledProcessError as e:
@@ -97,8 +229,9 @@ class SunaDesktopSetup:
         
         try:
             if method == 'git':
+                # Only the working tree is needed, not the project history
                 subprocess.run([
-                    'git', 'clone', 
+                    'git', 'clone', '--quiet', '--depth=1', '--single-branch',
                     'https://github.com/kortix-ai/suna.git', 
                     str(self.suna_dir)
                 ], check=True)
@@ -107,24 +240,12 @@ class SunaDesktopSetup:
                 url = "https://github.com/kortix-ai/suna/archive/refs/heads/master.zip"
                 print("📥 Downloading Suna as ZIP file...")
                 
-                response = requests.get(url, stream=True)
-                response.raise_for_status()
-                
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        tmp_file.write(chunk)
-                    zip_path = tmp_file.name
-                
-                # Extract ZIP
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(self.current_dir)
-                
-                # Rename extracted directory
-                extracted_dir = self.current_dir / "suna-master"
-                if extracted_dir.exists():
-                    extracted_dir.rename(self.suna_dir)
+                # The archive is small enough to keep in memory, which saves
+                # writing it to a temporary file only to read it back
+                data = self._fetch_bytes(url)
                 
-                os.unlink(zip_path)
+                # Extract ZIP straight into the Suna directory
+                self._extract_zip(data, self.suna_dir, strip_prefix="suna-master/")
             
             print("✅ Suna downloaded successfully")
             return True
@@ -133,65 +254,105 @@ class SunaDesktopSetup:
             print(f"❌ Failed to download Suna: {e}")
             return False
     
+    def _fetch_bytes(self, url):
+        """Download a URL into memory, over HTTP/2 when httpx and h2 are installed."""
+        # Only the ZIP download method gets here; the default git method
+        # shouldn't pay for importing an HTTP stack
+        from urllib.request import urlopen
+        
+        buffer = io.BytesIO()
+        try:
+            import httpx
+            import h2  # httpx needs it for http2=True
+        except ImportError:
+            httpx = None
+        
+        if httpx is not None:
+            with httpx.Client(http2=True, follow_redirects=True) as client:
+                with client.stream('GET', url) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        buffer.write(chunk)
+        else:
+            # urlopen follows GitHub's redirect to codeload and raises
+            # HTTPError on a bad status
+            with urlopen(url) as response:
+                shutil.copyfileobj(response, buffer, DOWNLOAD_CHUNK_SIZE)
+        
+        return buffer.getvalue()
+    
+    def _extract_zip(self, data, destination, strip_prefix="", workers=8):
+        """Extract an in-memory ZIP archive, spreading the files over threads.
+        
+        Members starting with strip_prefix are extracted without it, so an
+        archive's top-level folder can be unpacked straight into destination.
+        """
+        import zipfile
+        
+        with zipfile.ZipFile(io.BytesIO(data), 'r') as zip_ref:
+            members = []
+            for info in zip_ref.infolist():
+                # Only the target name changes; reading still goes by
+                # orig_filename and the header offset
+                if strip_prefix and info.filename.startswith(strip_prefix):
+                    info.filename = info.filename[len(strip_prefix):]
+                    if not info.filename:
+                        continue
+                members.append(info)
+            
+            # Create the directory tree first so workers rarely race on it
+            for info in members:
+                if info.is_dir():
+                    zip_ref.extract(info, destination)
+        
+        files = [info for info in members if not info.is_dir()]
+        
+        def extract_shard(shard):
+            # A ZipFile handle isn't safe to share between threads, so each
+            # worker opens its own over the same bytes
+            with zipfile.ZipFile(io.BytesIO(data), 'r') as zip_ref:
+                for info in shard:
+                    try:
+                        zip_ref.extract(info, destination)
+                    except FileExistsError:
+                        # Another worker created the parent directory between
+                        # the existence check and makedirs; it exists now
+                        zip_ref.extract(info, destination)
+        
+        # Inflating and writing both release the GIL, so the shards overlap
+        workers = max(1, min(workers, len(files)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(extract_shard, [files[i::workers] for i in range(workers)]))
+    
+    def _create_file(self, path, content):
+        """Write content to path only if it doesn't exist yet; return whether it was created."""
+        # Exclusive create checks and creates in one step, so there's no
+        # separate stat and no window for the file to appear in between
+        try:
+            with open(path, 'xb') as f:
+                f.write(content)
+        except FileExistsError:
+            return False
+        return True
+    
     def setup_suna_environment(self):
         """Set up Suna environment files."""
         print("\n⚙️  Setting up Suna environment...")
         
+        # Make sure both target directories exist before writing into them
+        for subdir in ('backend', 'frontend'):
+            (self.suna_dir / subdir).mkdir(parents=True, exist_ok=True)
+        
         # Backend environment
         backend_env_path = self.suna_dir / 'backend' / '.env'
-        if not backend_env_path.exists():
-            env_content = """# Suna Backend Configuration
-# Generated by Suna Desktop Setup
-
-# Redis Configuration
-REDIS_HOST=redis
-REDIS_PORT=6379
-REDIS_PASSWORD=
-REDIS_SSL=False
-
-# RabbitMQ Configuration
-RABBITMQ_HOST=rabbitmq
-RABBITMQ_PORT=5672
-
-# LLM Configuration
-# Add your API keys here:
-ANTHROPIC_API_KEY=
-OPENAI_API_KEY=
-OPENROUTER_API_KEY=
-
-# Database Configuration
-# For local setup, you can use Supabase cloud or local instance
-SUPABASE_URL=
-SUPABASE_KEY=
-SUPABASE_SERVICE_ROLE_KEY=
-
-# Search and Web Scraping (Optional)
-TAVILY_API_KEY=
-FIRECRAWL_API_KEY=
-
-# Background Jobs
-QSTASH_URL=
-QSTASH_TOKEN=
-
-# Daytona Configuration (for agent execution)
-DAYTONA_SERVER_URL=
-DAYTONA_API_KEY=
-"""
-            backend_env_path.write_text(env_content)
+        if self._create_file(backend_env_path, BACKEND_ENV_TEMPLATE.encode()):
             print(f"✅ Created backend environment file: {backend_env_path}")
         else:
             print(f"✅ Backend environment file already exists: {backend_env_path}")
         
         # Frontend environment
         frontend_env_path = self.suna_dir / 'frontend' / '.env.local'
-        if not frontend_env_path.exists():
-            env_content = """# Suna Frontend Configuration
-# Generated by Suna Desktop Setup
-
-NEXT_PUBLIC_BACKEND_URL=http://localhost:8000
-NEXT_PUBLIC_FRONTEND_URL=http://localhost:3000
-"""
-            frontend_env_path.write_text(env_content)
+        if self._create_file(frontend_env_path, FRONTEND_ENV_TEMPLATE.encode()):
             print(f"✅ Created frontend environment file: {frontend_env_path}")
         else:
             print(f"✅ Frontend environment file already exists: {frontend_env_path}")
@@ -210,12 +371,11 @@ NEXT_PUBLIC_FRONTEND_URL=http://localhost:3000
             "auto_start_services": False,
             "auto_start_mobile_web": True,
             "setup_completed": True,
-            "setup_date": str(Path(__file__).stat().st_mtime)
+            "setup_date": time.time()
         }
         
         config_path = self.current_dir / "suna_desktop_config.json"
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        config_path.write_bytes(json.dumps(config, indent=2).encode('utf-8'))
         
         print(f"✅ Desktop configuration saved: {config_path}")
         return True
@@ -225,112 +385,78 @@ NEXT_PUBLIC_FRONTEND_URL=http://localhost:3000
         print("\n🚀 Creating launcher scripts...")
         
         # Python launcher script
-        launcher_content = f"""#!/usr/bin/env python3
-\"\"\"
-Suna Desktop Launcher
-Quick launcher for the Suna Desktop application.
-\"\"\"
-
-import os
-import sys
-import subprocess
-from pathlib import Path
-
-# Add current directory to Python path
-sys.path.insert(0, str(Path(__file__).parent))
-
-def main():
-    try:
-        from suna_desktop import main as suna_main
-        suna_main()
-    except ImportError as e:
-        print(f"Error importing Suna Desktop: {{e}}")
-        print("Please ensure all dependencies are installed:")
-        print("pip install -r requirements.txt")
-        sys.exit(1)
-    except KeyboardInterrupt:
-        print("\\nSuna Desktop application closed.")
-    except Exception as e:
-        print(f"Error running Suna Desktop: {{e}}")
-        sys.exit(1)
-
-if __name__ == "__main__":
-    main()
-"""
-        
         launcher_path = self.current_dir / "run_suna_desktop.py"
-        launcher_path.write_text(launcher_content)
+        launcher_path.write_bytes(LAUNCHER_SCRIPT.encode())
         launcher_path.chmod(0o755)
         print(f"✅ Created Python launcher: {launcher_path}")
         
-        # Create batch file for Windows
-        if sys.platform == "win32":
-            batch_content = f"""@echo off
-echo Starting Suna Desktop...
-python "{launcher_path}"
-pause
-"""
-            batch_path = self.current_dir / "run_suna_desktop.bat"
-            batch_path.write_text(batch_content)
-            print(f"✅ Created Windows batch file: {batch_path}")
-        
-        # Create shell script for Unix-like systems
-        else:
-            shell_content = f"""#!/bin/bash
-echo "Starting Suna Desktop..."
-python3 "{launcher_path}"
-"""
-            shell_path = self.current_dir / "run_suna_desktop.sh"
-            shell_path.write_text(shell_content)
-            shell_path.chmod(0o755)
-            print(f"✅ Created shell script: {shell_path}")
+        self._write_platform_launcher(launcher_path)
         
         return True
     
+    def _write_batch_launcher(self, launcher_path):
+        """Create the batch file launcher for Windows."""
+        batch_path = self.current_dir / "run_suna_desktop.bat"
+        batch_content = WINDOWS_LAUNCHER_TEMPLATE.format(launcher_path=launcher_path)
+        batch_path.write_bytes(batch_content.replace('\n', '\r\n').encode())
+        print(f"✅ Created Windows batch file: {batch_path}")
+    
+    def _write_shell_launcher(self, launcher_path):
+        """Create the shell script launcher for Unix-like systems."""
+        shell_path = self.current_dir / "run_suna_desktop.sh"
+        shell_content = SHELL_LAUNCHER_TEMPLATE.format(launcher_path=launcher_path)
+        shell_path.write_bytes(shell_content.encode())
+        shell_path.chmod(0o755)
+        print(f"✅ Created shell script: {shell_path}")
+    
     def print_next_steps(self):
         """Print next steps for the user."""
-        print("\n" + "="*60)
-        print("🎉 Suna Desktop Setup Complete!")
-        print("="*60)
-        
-        print("\n📋 Next Steps:")
-        print("\n1. Configure API Keys:")
-        print(f"   Edit: {self.suna_dir}/backend/.env")
-        print("   Add your LLM API keys (Anthropic, OpenAI, etc.)")
-        
-        print("\n2. Set up Database:")
-        print("   • Create a Supabase project at https://supabase.com")
-        print("   • Add the Supabase URL and keys to the .env file")
-        print("   • Or use the built-in setup wizard in the desktop app")
-        
-        print("\n3. Start Suna Desktop:")
-        if sys.platform == "win32":
-            print("   Double-click: run_suna_desktop.bat")
+        # Build the whole summary and write it once; on Windows every
+        # separate print is its own round trip to the console
+        lines = []
+        lines.append("\n" + "="*60)
+        lines.append("🎉 Suna Desktop Setup Complete!")
+        lines.append("="*60)
+        
+        lines.append("\n📋 Next Steps:")
+        lines.append("\n1. Configure API Keys:")
+        lines.append(f"   Edit: {self.suna_dir}/backend/.env")
+        lines.append("   Add your LLM API keys (Anthropic, OpenAI, etc.)")
+        
+        lines.append("\n2. Set up Database:")
+        lines.append("   • Create a Supabase project at https://supabase.com")
+        lines.append("   • Add the Supabase URL and keys to the .env file")
+        lines.append("   • Or use the built-in setup wizard in the desktop app")
+        
+        lines.append("\n3. Start Suna Desktop:")
+        if self._is_windows:
+            lines.append("   Double-click: run_suna_desktop.bat")
         else:
-            print("   Run: ./run_suna_desktop.sh")
-        print("   Or: python run_suna_desktop.py")
-        
-        print("\n4. Access Suna:")
-        print("   • Desktop GUI: Use the application interface")
-        print("   • Web Interface: http://localhost:3000 (after starting services)")
-        print("   • Mobile Interface: http://localhost:5000")
-        print("   • API Documentation: http://localhost:8000/docs")
-        
-        print("\n📱 Mobile Access:")
-        print("   The mobile web interface allows you to access Suna")
-        print("   from smartphones, tablets, or other devices on your network.")
-        print(f"   Use your computer's IP address: http://[YOUR_IP]:5000")
-        
-        print("\n🔧 Troubleshooting:")
-        print("   • Check Docker is running before starting services")
-        print("   • Ensure ports 3000, 5000, and 8000 are available")
-        print("   • Check the Setup tab in the desktop app for requirements")
-        
-        print("\n📚 Documentation:")
-        print("   • Suna Repository: https://github.com/kortix-ai/suna")
-        print("   • Self-hosting Guide: https://github.com/kortix-ai/suna/blob/master/docs/SELF-HOSTING.md")
-        
-        print("\n" + "="*60)
+            lines.append("   Run: ./run_suna_desktop.sh")
+        lines.append("   Or: python run_suna_desktop.py")
+        
+        lines.append("\n4. Access Suna:")
+        lines.append("   • Desktop GUI: Use the application interface")
+        lines.append("   • Web Interface: http://localhost:3000 (after starting services)")
+        lines.append("   • Mobile Interface: http://localhost:5000")
+        lines.append("   • API Documentation: http://localhost:8000/docs")
+        
+        lines.append("\n📱 Mobile Access:")
+        lines.append("   The mobile web interface allows you to access Suna")
+        lines.append("   from smartphones, tablets, or other devices on your network.")
+        lines.append(f"   Use your computer's IP address: http://[YOUR_IP]:5000")
+        
+        lines.append("\n🔧 Troubleshooting:")
+        lines.append("   • Check Docker is running before starting services")
+        lines.append("   • Ensure ports 3000, 5000, and 8000 are available")
+        lines.append("   • Check the Setup tab in the desktop app for requirements")
+        
+        lines.append("\n📚 Documentation:")
+        lines.append("   • Suna Repository: https://github.com/kortix-ai/suna")
+        lines.append("   • Self-hosting Guide: https://github.com/kortix-ai/suna/blob/master/docs/SELF-HOSTING.md")
+        
+        lines.append("\n" + "="*60)
+        print("\n".join(lines))
     
     def run_setup(self, download_method='git'):
         """Run the complete setup process."""
@@ -6,63 +6,178 @@ Integrated chat component for the Suna Desktop application.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
-import requests
-import json
 import threading
 import time
 import os
-from datetime import datetime
-import uuid
-from typing import Optional, Dict, Any, List
+import socket
 import queue
+import mimetypes
+from typing import Optional, Dict, Any, List, Tuple
+import collections
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+from suna_stream_decode import decode_stream
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # httpx needs it for HTTP/2
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# requests is only the fallback client and is slow to import, so it isn't
+# loaded at all when httpx is available
+MultipartEncoder = None
+if httpx is None:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    try:
+        from requests_toolbelt import MultipartEncoder
+    except ImportError:
+        pass
+
+# Read size for the response stream; each HTTP chunk is still handed over as
+# soon as it arrives, this only caps how much is taken per read
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Tk's Text widget slows down as it grows, so only the tail of a long
+# conversation is kept in it; older lines move to a scrollback buffer and
+# are paged back in when the view reaches the top
+MAX_CHAT_LINES = 1500
+CHAT_TRIM_TO_LINES = 1000
+CHAT_PAGE_LINES = 200
+CHAT_SCROLLBACK_PIECES = 2000
+
+# The response queue is drained on a virtual event; this fallback timer
+# runs every second while busy and backs off to a few seconds when idle
+WATCHDOG_MIN_MS = 1000
+WATCHDOG_MAX_MS = 8000
+
+# How long a successful health check is reused before probing again
+HEALTH_CACHE_SECONDS = 10
+
+# Every attachment goes up in the single initiate request, so their total
+# size is capped rather than letting one selection build a huge upload
+MAX_ATTACHMENT_BYTES = 50 * 1024 * 1024
 
 class SunaAPI:
     """API client for communicating with Suna backend."""
     
+    # Form fields sent with every new conversation besides the prompt
+    AGENT_OPTIONS = {
+        'model_name': 'claude-3-5-sonnet-20241022',
+        'enable_thinking': 'false',
+        'reasoning_effort': 'low',
+        'stream': 'true',
+        'enable_context_manager': 'false'
+    }
+    
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "User-Agent": "Suna Desktop/1.0"
-        })
+        # Form posts need their own Content-Type (with the multipart
+        # boundary), so none is set for the whole client
+        headers = {"User-Agent": "Suna Desktop/1.0"}
+        # Runs the user has stopped; their streams end at the next chunk
+        self._stopped_runs = set()
+        # Sockets of open streams by run, so a stop can cut a stalled read
+        self._stream_sockets = {}
+        self._last_healthy = float("-inf")
+        
+        if httpx is not None:
+            # One pooled client; over HTTP/2 the stream and the stop/health
+            # calls share a single connection. HTTP/2 is only negotiated on
+            # https URLs, so a plain http://localhost backend stays on
+            # HTTP/1.1 and those calls use pooled connections instead.
+            # Idle connections are kept for longer than httpx's 5 second
+            # default so they survive the gap between messages, and a failed
+            # connect is retried a couple of times, like the requests
+            # adapter below does.
+            transport = httpx.HTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4,
+                                    keepalive_expiry=60.0),
+                retries=2
+            )
+            self.client = httpx.Client(
+                transport=transport,
+                timeout=httpx.Timeout(300.0, connect=5.0),
+                headers=headers
+            )
+        else:
+            self.client = requests.Session()
+            self.client.headers.update(headers)
+            
+            # A small keep-alive pool so the stream, stop and health calls can
+            # run side by side without evicting each other's connections.
+            # Idempotent requests get a couple of quick retries on gateway
+            # errors; the final response is still returned rather than raised.
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.2,
+                                  status_forcelist=[502, 503, 504], raise_on_status=False)
+            )
+            self.client.mount("http://", adapter)
+            self.client.mount("https://", adapter)
     
     def health_check(self) -> bool:
         """Check if Suna API is accessible."""
+        # A recent success is trusted for a few seconds; failures aren't
+        # cached so Reconnect notices a backend that has just come up
+        if time.monotonic() - self._last_healthy < HEALTH_CACHE_SECONDS:
+            return True
         try:
-            response = self.session.get(f"{self.base_url}/api/health", timeout=5)
-            return response.status_code == 200
+            response = self.client.get(f"{self.base_url}/api/health", timeout=5)
+            healthy = response.status_code == 200
         except:
-            return False
+            healthy = False
+        if healthy:
+            self._last_healthy = time.monotonic()
+        return healthy
     
-    def initiate_agent(self, prompt: str, files: List[str] = None) -> Dict[str, Any]:
-        """Initiate a new agent conversation."""
+    def initiate_agent(self, prompt: str, files: List[Tuple[str, str]] = None) -> Dict[str, Any]:
+        """Initiate a new agent conversation; files are (path, filename) pairs."""
         try:
-            data = {
-                'prompt': prompt,
-                'model_name': 'claude-3-5-sonnet-20241022',
-                'enable_thinking': 'false',
-                'reasoning_effort': 'low',
-                'stream': 'true',
-                'enable_context_manager': 'false'
-            }
-            
-            files_data = []
-            if files:
-                for file_path in files:
-                    if os.path.exists(file_path):
-                        files_data.append(('files', (os.path.basename(file_path), open(file_path, 'rb'))))
-            
-            response = self.session.post(
-                f"{self.base_url}/api/agent/initiate",
-                data=data,
-                files=files_data if files_data else None,
-                timeout=30
-            )
+            data = {'prompt': prompt, **self.AGENT_OPTIONS}
             
-            # Close file handles
-            for _, (_, file_handle) in files_data:
-                file_handle.close()
+            # Every opened attachment is closed on the way out, even if a
+            # later open or the request itself fails
+            with contextlib.ExitStack() as stack:
+                files_data = []
+                if files:
+                    for file_path, file_name in files:
+                        file_handle = stack.enter_context(open(file_path, 'rb'))
+                        # Typed explicitly so every client sends the same part
+                        # headers; only httpx would otherwise guess one
+                        content_type = mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
+                        files_data.append(('files', (file_name, file_handle, content_type)))
+                
+                url = f"{self.base_url}/api/agent/initiate"
+                if files_data and MultipartEncoder is not None:
+                    # requests reads every attachment into memory to build the
+                    # form body; the encoder streams it from the open files
+                    encoder = MultipartEncoder(fields=list(data.items()) + files_data)
+                    response = self.client.post(
+                        url,
+                        data=encoder,
+                        headers={"Content-Type": encoder.content_type},
+                        timeout=30
+                    )
+                else:
+                    # httpx already streams file objects in a multipart body
+                    response = self.client.post(
+                        url,
+                        data=data,
+                        files=files_data if files_data else None,
+                        timeout=30
+                    )
             
             if response.status_code == 200:
                 return response.json()
@@ -75,30 +190,64 @@ class SunaAPI:
     def stream_agent_responses(self, agent_run_id: str, callback_func):
         """Stream agent responses in real-time."""
         try:
-            response = self.session.get(
-                f"{self.base_url}/api/agent-run/{agent_run_id}/stream",
-                stream=True,
-                timeout=300
-            )
+            chunks = self._iter_stream(f"{self.base_url}/api/agent-run/{agent_run_id}/stream", agent_run_id)
+            for data in decode_stream(chunks):
+                if agent_run_id in self._stopped_runs:
+                    # Stop was requested; drop what's still in flight
+                    # rather than waiting for the server to wind down
+                    return
+                callback_func(data)
             
-            if response.status_code == 200:
-                for line in response.iter_lines():
-                    if line:
-                        try:
-                            data = json.loads(line.decode('utf-8'))
-                            callback_func(data)
-                        except json.JSONDecodeError:
-                            callback_func({"type": "raw", "content": line.decode('utf-8')})
-            else:
-                raise Exception(f"Stream Error: {response.status_code} - {response.text}")
-                
         except Exception as e:
-            callback_func({"type": "error", "content": f"Streaming failed: {e}"})
+            # A stop cuts the connection, which surfaces here as a broken read
+            if agent_run_id not in self._stopped_runs:
+                callback_func({"type": "error", "content": f"Streaming failed: {e}"})
+        finally:
+            self._stream_sockets.pop(agent_run_id, None)
+            self._stopped_runs.discard(agent_run_id)
+    
+    def _iter_stream(self, url: str, agent_run_id: str):
+        """Yield the body of a streamed GET in chunks as they arrive."""
+        if httpx is not None:
+            with self.client.stream("GET", url) as response:
+                if response.status_code != 200:
+                    response.read()
+                    raise Exception(f"Stream Error: {response.status_code} - {response.text}")
+                # Over HTTP/2 the connection is shared with other requests,
+                # so it's never cut; the stopped-run check ends those streams
+                if response.http_version != "HTTP/2":
+                    network_stream = response.extensions.get("network_stream")
+                    if network_stream is not None:
+                        self._stream_sockets[agent_run_id] = network_stream.get_extra_info("socket")
+                # No chunk_size here: httpx would hold data back until it
+                # had filled a whole chunk
+                yield from response.iter_bytes()
+        else:
+            with self.client.get(url, stream=True, timeout=300) as response:
+                if response.status_code != 200:
+                    raise Exception(f"Stream Error: {response.status_code} - {response.text}")
+                # urllib3 keeps the connection (and its socket) on the raw response
+                connection = getattr(response.raw, "_connection", None)
+                if connection is not None:
+                    self._stream_sockets[agent_run_id] = connection.sock
+                yield from response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
     
     def stop_agent(self, agent_run_id: str) -> bool:
         """Stop a running agent."""
+        self._stopped_runs.add(agent_run_id)
+        
+        # Closing the response from here wouldn't wake a read that's waiting
+        # on a quiet server, but shutting its socket down does, so the
+        # stream ends now instead of whenever the server next sends
+        stream_socket = self._stream_sockets.pop(agent_run_id, None)
+        if stream_socket is not None:
+            try:
+                stream_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        
         try:
-            response = self.session.post(
+            response = self.client.post(
                 f"{self.base_url}/api/agent-run/{agent_run_id}/stop",
                 timeout=10
             )
@@ -109,6 +258,23 @@ class SunaAPI:
 class SunaChatInterface:
     """Integrated chat interface for Suna Desktop."""
     
+    # Styling for the chat display's text tags
+    CHAT_TAGS = {
+        "user": {"foreground": "#2563eb", "font": ("Consolas", 10, "bold")},
+        "assistant": {"foreground": "#059669", "font": ("Consolas", 10)},
+        "system": {"foreground": "#6b7280", "font": ("Consolas", 9, "italic")},
+        "error": {"foreground": "#dc2626", "font": ("Consolas", 10, "bold")},
+        "timestamp": {"foreground": "#9ca3af", "font": ("Consolas", 8)},
+    }
+    
+    FILE_TYPES = (
+        ("All files", "*.*"),
+        ("Text files", "*.txt *.md *.csv"),
+        ("Images", "*.png *.jpg *.jpeg *.gif *.bmp"),
+        ("Documents", "*.pdf *.doc *.docx"),
+        ("Code files", "*.py *.js *.html *.css *.json *.xml *.yaml *.yml"),
+    )
+    
     def __init__(self, parent_frame):
         self.parent = parent_frame
         self.api = SunaAPI()
@@ -117,13 +283,45 @@ class SunaChatInterface:
         self.current_thread_id = None
         self.current_agent_run_id = None
         self.is_streaming = False
+        # (path, filename) pairs, checked once when they're added
         self.attached_files = []
-        
-        # Threading
-        self.response_queue = queue.Queue()
+        self._attached_bytes = 0
+        # Tracked instead of reading the whole transcript back on each append
+        self._chat_empty = True
+        # (text, tag) pieces currently shown in the widget, and older ones
+        # trimmed out of it
+        self._chat_pieces = collections.deque()
+        self._chat_lines = 0
+        self._chat_scrollback = collections.deque(maxlen=CHAT_SCROLLBACK_PIECES)
+        self._paging_in = False
+        # see() relayouts the widget, so it runs once per batch of appends
+        self._scroll_pending = False
+        self._timestamp_cache = (0, "")
+        # Pieces appended while draining the response queue; they go into
+        # the widget with one insert at the end of the drain
+        self._draining = False
+        self._drain_pieces = []
+        
+        # Threading: workers queue updates and wake the Tk thread with a
+        # virtual event, so there's no need to poll on a short timer
+        # deque append/popleft are atomic, so the workers and the Tk thread
+        # can share it without queue.Queue's lock and condition variable
+        self.response_queue = collections.deque()
+        self._notify_lock = threading.Lock()
+        self._notify_pending = False
+        self._watchdog_ms = WATCHDOG_MIN_MS
+        self.parent.bind("<<SunaResponse>>", lambda e: self.check_response_queue())
+        
+        # Short API calls (health checks, stop) reuse a few pooled threads
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="suna")
+        self._checking_connection = False
+        # Messages are sent one after another by a single long-lived worker
+        self._send_queue = queue.Queue()
+        self._send_thread = None
+        self.parent.bind("<Destroy>", self._on_destroy, add="+")
         
         self.setup_interface()
-        self.check_response_queue()
+        self._response_watchdog()
     
     def setup_interface(self):
         """Set up the chat interface."""
@@ -168,13 +366,11 @@ class SunaChatInterface:
             font=("Consolas", 10)
         )
         self.chat_display.pack(fill=tk.BOTH, expand=True)
+        self.chat_display.configure(yscrollcommand=self._on_chat_yscroll)
         
         # Configure text tags for styling
-        self.chat_display.tag_configure("user", foreground="#2563eb", font=("Consolas", 10, "bold"))
-        self.chat_display.tag_configure("assistant", foreground="#059669", font=("Consolas", 10))
-        self.chat_display.tag_configure("system", foreground="#6b7280", font=("Consolas", 9, "italic"))
-        self.chat_display.tag_configure("error", foreground="#dc2626", font=("Consolas", 10, "bold"))
-        self.chat_display.tag_configure("timestamp", foreground="#9ca3af", font=("Consolas", 8))
+        for tag, options in self.CHAT_TAGS.items():
+            self.chat_display.tag_configure(tag, **options)
         
         # Input area
         input_frame = ttk.Frame(main_frame)
@@ -217,35 +413,58 @@ class SunaChatInterface:
     
     def check_connection(self):
         """Check connection to Suna API."""
+        # Against a dead host each check waits out the connect timeout, so
+        # repeated Reconnect clicks must not pile checks up in the pool
+        # that stop requests also use
+        if self._checking_connection:
+            return
+        self._checking_connection = True
+        self.connection_label.config(text="Checking connection...", foreground="orange")
+        
         def check_worker():
             if self.api.health_check():
-                self.response_queue.put(("connection", "success"))
+                self._post_response("connection", "success")
             else:
-                self.response_queue.put(("connection", "failed"))
+                self._post_response("connection", "failed")
         
-        threading.Thread(target=check_worker, daemon=True).start()
+        self._pool.submit(check_worker)
     
     def add_files(self):
         """Add files to attach to the next message."""
         files = filedialog.askopenfilenames(
             title="Select files to attach",
-            filetypes=[
-                ("All files", "*.*"),
-                ("Text files", "*.txt *.md *.csv"),
-                ("Images", "*.png *.jpg *.jpeg *.gif *.bmp"),
-                ("Documents", "*.pdf *.doc *.docx"),
-                ("Code files", "*.py *.js *.html *.css *.json *.xml *.yaml *.yml")
-            ]
+            filetypes=self.FILE_TYPES
         )
         
+        attached = {path for path, _ in self.attached_files}
+        skipped = []
         for file_path in files:
-            if file_path not in self.attached_files:
-                self.attached_files.append(file_path)
-                self.files_listbox.insert(tk.END, os.path.basename(file_path))
+            if file_path in attached:
+                continue
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                continue
+            file_name = os.path.basename(file_path)
+            if self._attached_bytes + size > MAX_ATTACHMENT_BYTES:
+                skipped.append(file_name)
+                continue
+            attached.add(file_path)
+            self._attached_bytes += size
+            self.attached_files.append((file_path, file_name))
+            self.files_listbox.insert(tk.END, file_name)
+        
+        if skipped:
+            limit_mb = MAX_ATTACHMENT_BYTES // (1024 * 1024)
+            messagebox.showwarning(
+                "Warning",
+                f"Attachments are limited to {limit_mb} MB in total. Not attached:\n" + "\n".join(skipped)
+            )
     
     def clear_files(self):
         """Clear all attached files."""
         self.attached_files.clear()
+        self._attached_bytes = 0
         self.files_listbox.delete(0, tk.END)
     
     def new_chat(self):
@@ -258,6 +477,10 @@ class SunaChatInterface:
         self.chat_display.config(state=tk.NORMAL)
         self.chat_display.delete(1.0, tk.END)
         self.chat_display.config(state=tk.DISABLED)
+        self._chat_empty = True
+        self._chat_pieces.clear()
+        self._chat_lines = 0
+        self._chat_scrollback.clear()
         
         # Clear files
         self.clear_files()
@@ -281,76 +504,184 @@ class SunaChatInterface:
         # Disable send button
         self.send_btn.config(state=tk.DISABLED)
         
-        # Start processing in background
-        threading.Thread(target=self._send_message_worker, args=(message,), daemon=True).start()
+        # Start processing in background. The sender is a daemon thread
+        # rather than a pool worker: pool workers are joined at exit, and a
+        # stream waiting on the server would keep the app from closing. It
+        # is started once and then reused for every message.
+        if self._send_thread is None:
+            self._send_thread = threading.Thread(target=self._send_loop, name="suna-send", daemon=True)
+            self._send_thread.start()
+        self._send_queue.put(message)
+    
+    def _send_loop(self):
+        """Send queued messages until the chat goes away."""
+        while True:
+            message = self._send_queue.get()
+            if message is None:
+                return
+            self._send_message_worker(message)
     
     def _send_message_worker(self, message: str):
         """Background worker for sending messages."""
         try:
             if not self.current_thread_id:
                 # First message - initiate agent
-                self.response_queue.put(("system", "🚀 Initiating new conversation..."))
+                self._post_response("system", "🚀 Initiating new conversation...")
                 
                 result = self.api.initiate_agent(message, self.attached_files)
-                self.current_thread_id = result.get("thread_id")
+                if not result.get("thread_id"):
+                    raise Exception(f"Unexpected response from Suna: {result}")
+                self.current_thread_id = result["thread_id"]
                 self.current_agent_run_id = result.get("agent_run_id")
                 
-                self.response_queue.put(("system", f"✅ Conversation started (ID: {self.current_thread_id[:8]}...)"))
-                self.response_queue.put(("clear_files", None))
+                self._post_response("system", f"✅ Conversation started (ID: {self.current_thread_id[:8]}...)")
+                self._post_response("clear_files", None)
             
             # Start streaming responses
             if self.current_agent_run_id:
                 self.is_streaming = True
-                self.response_queue.put(("enable_stop", None))
-                self.response_queue.put(("stream_start", None))
+                self._post_response("enable_stop", None)
+                self._post_response("stream_start", None)
                 
                 self.api.stream_agent_responses(self.current_agent_run_id, self._handle_stream_response)
         
         except Exception as e:
-            self.response_queue.put(("error", f"❌ Error: {str(e)}"))
+            self._post_response("error", f"❌ Error: {str(e)}")
         finally:
             self.is_streaming = False
-            self.response_queue.put(("enable_send", None))
-            self.response_queue.put(("disable_stop", None))
+            self._post_response("send_done", None)
     
     def _handle_stream_response(self, data: Dict[str, Any]):
-        """Handle streaming response data."""
-        self.response_queue.put(("stream_data", data))
+        """Turn a stream chunk into display text on the network thread."""
+        data_type = data.get("type", "")
+        
+        if data_type == "delta":
+            # Handle streaming text chunks
+            delta_content = data.get("delta", {}).get("content", "")
+            if delta_content:
+                self._post_response("delta", delta_content)
+        
+        elif data_type == "message":
+            # Handle complete messages
+            content = data.get("content", "")
+            role = data.get("role", "assistant")
+            if content and role == "assistant":
+                self._post_response("append", (f"🤖 Suna: {content}", "assistant"))
+        
+        elif data_type == "tool_use":
+            # Handle tool usage
+            tool_name = data.get("name", "unknown")
+            self._post_response("append", (f"🔧 Using tool: {tool_name}", "system"))
+        
+        elif data_type == "tool_result":
+            # Handle tool results
+            self._post_response("append", ("✅ Tool completed", "system"))
+        
+        elif data_type == "error":
+            content = data.get("content", "Unknown error")
+            self._post_response("append", (f"❌ Error: {content}", "error"))
+        
+        elif data_type == "done":
+            self._post_response("append", ("\n✅ Response complete", "system"))
+            self.is_streaming = False
+            self._post_response("send_done", None)
     
     def stop_agent(self):
         """Stop the currently running agent."""
         if self.current_agent_run_id:
-            threading.Thread(target=self._stop_agent_worker, daemon=True).start()
+            self._pool.submit(self._stop_agent_worker)
+    
+    def _on_destroy(self, event):
+        """Let the workers wind down once the chat frame goes away."""
+        if event.widget is self.parent:
+            self._pool.shutdown(wait=False)
+            self._send_queue.put(None)
     
     def _stop_agent_worker(self):
         """Background worker for stopping agent."""
         try:
             if self.api.stop_agent(self.current_agent_run_id):
-                self.response_queue.put(("system", "⏹️ Agent stopped successfully"))
+                self._post_response("system", "⏹️ Agent stopped successfully")
             else:
-                self.response_queue.put(("error", "❌ Failed to stop agent"))
+                self._post_response("error", "❌ Failed to stop agent")
         except Exception as e:
-            self.response_queue.put(("error", f"❌ Error stopping agent: {str(e)}"))
+            self._post_response("error", f"❌ Error stopping agent: {str(e)}")
         finally:
             self.is_streaming = False
-            self.response_queue.put(("enable_send", None))
-            self.response_queue.put(("disable_stop", None))
+            self._post_response("send_done", None)
+    
+    def _post_response(self, msg_type: str, data: Any):
+        """Queue an update for the UI and wake the Tk thread to apply it."""
+        self.response_queue.append((msg_type, data))
+        
+        # One wake-up per drain is enough; event_generate from a worker
+        # thread is a synchronous hop to the Tk thread
+        with self._notify_lock:
+            if self._notify_pending:
+                return
+            self._notify_pending = True
+        try:
+            self.parent.event_generate("<<SunaResponse>>", when="tail")
+        except (RuntimeError, tk.TclError):
+            # Main loop not running (yet); the watchdog picks this up
+            pass
     
-    def check_response_queue(self):
-        """Check for responses and update UI."""
+    def _response_watchdog(self):
+        """Drain the queue now and then in case a wake-up was missed."""
+        # Back off while nothing is happening so an idle window isn't woken
+        # every second; any activity brings the interval back down
+        if self.check_response_queue() or self.is_streaming:
+            self._watchdog_ms = WATCHDOG_MIN_MS
+        else:
+            self._watchdog_ms = min(self._watchdog_ms * 2, WATCHDOG_MAX_MS)
+        self.parent.after(self._watchdog_ms, self._response_watchdog)
+    
+    def check_response_queue(self) -> bool:
+        """Check for responses and update UI; returns whether there were any."""
+        with self._notify_lock:
+            self._notify_pending = False
+        
+        # Consecutive stream deltas are joined and inserted in one go, so a
+        # burst of tokens costs one widget update instead of one per token
+        pending_text = []
+        handled = False
+        self._draining = True
         try:
             while True:
-                msg_type, data = self.response_queue.get_nowait()
+                try:
+                    msg_type, data = self.response_queue.popleft()
+                except IndexError:
+                    break
+                handled = True
+                if msg_type == "delta":
+                    pending_text.append(data)
+                    continue
+                
+                if pending_text:
+                    self._append_assistant_bulk("".join(pending_text))
+                    pending_text = []
                 self._process_response(msg_type, data)
-        except queue.Empty:
-            pass
+            
+            if pending_text:
+                self._append_assistant_bulk("".join(pending_text))
+        finally:
+            self._draining = False
+            pieces, self._drain_pieces = self._drain_pieces, []
+            if pieces:
+                self._insert_chat(pieces)
         
-        # Schedule next check
-        self.parent.after(100, self.check_response_queue)
+        return handled
     
     def _process_response(self, msg_type: str, data: Any):
         """Process different types of responses."""
-        if msg_type == "connection":
+        # Deltas never get here; stream chunks are by far the most common
+        # of the rest, so they're checked first
+        if msg_type == "append":
+            # Stream chunks arrive already rendered as (text, tag)
+            self.append_to_chat(*data)
+        
+        elif msg_type == "connection":
+            self._checking_connection = False
             if data == "success":
                 self.connection_label.config(text="🟢 Connected to Suna", foreground="green")
                 self.send_btn.config(state=tk.NORMAL)
@@ -369,76 +700,133 @@ class SunaChatInterface:
         elif msg_type == "clear_files":
             self.clear_files()
         
-        elif msg_type == "enable_send":
-            self.send_btn.config(state=tk.NORMAL)
-        
         elif msg_type == "enable_stop":
             self.stop_btn.config(state=tk.NORMAL)
         
-        elif msg_type == "disable_stop":
+        elif msg_type == "send_done":
+            # A send is over, however it ended
+            self.send_btn.config(state=tk.NORMAL)
             self.stop_btn.config(state=tk.DISABLED)
         
         elif msg_type == "stream_start":
             self.append_to_chat("🤖 Suna: ", "assistant", newline=False)
-        
-        elif msg_type == "stream_data":
-            self._handle_stream_data(data)
     
-    def _handle_stream_data(self, data: Dict[str, Any]):
-        """Handle individual stream data chunks."""
-        data_type = data.get("type", "")
-        
-        if data_type == "delta":
-            # Handle streaming text chunks
-            delta_content = data.get("delta", {}).get("content", "")
-            if delta_content:
-                self.append_to_chat(delta_content, "assistant", newline=False)
+    def append_to_chat(self, text: str, tag: str = "", newline: bool = True):
+        """Append text to the chat display."""
+        pieces = []
         
-        elif data_type == "message":
-            # Handle complete messages
-            content = data.get("content", "")
-            role = data.get("role", "assistant")
-            if content and role == "assistant":
-                self.append_to_chat(f"🤖 Suna: {content}", "assistant")
+        if newline and not self._chat_empty:
+            pieces.append(("\n", ""))
         
-        elif data_type == "tool_use":
-            # Handle tool usage
-            tool_name = data.get("name", "unknown")
-            self.append_to_chat(f"🔧 Using tool: {tool_name}", "system")
+        # Add timestamp for new messages
+        if newline and tag in ["user", "assistant", "system", "error"]:
+            pieces.append((f"[{self._timestamp()}] ", "timestamp"))
         
-        elif data_type == "tool_result":
-            # Handle tool results
-            self.append_to_chat("✅ Tool completed", "system")
+        pieces.append((text, tag))
         
-        elif data_type == "error":
-            content = data.get("content", "Unknown error")
-            self.append_to_chat(f"❌ Error: {content}", "error")
+        if newline:
+            pieces.append(("\n", ""))
         
-        elif data_type == "done":
-            self.append_to_chat("\n✅ Response complete", "system")
-            self.is_streaming = False
-            self.response_queue.put(("enable_send", None))
-            self.response_queue.put(("disable_stop", None))
+        self._insert_chat(pieces)
     
-    def append_to_chat(self, text: str, tag: str = "", newline: bool = True):
-        """Append text to the chat display."""
-        self.chat_display.config(state=tk.NORMAL)
+    def _append_assistant_bulk(self, text: str):
+        """Append a run of streamed assistant text with a single insert."""
+        self._insert_chat([(text, "assistant")])
+    
+    def _insert_chat(self, pieces):
+        """Insert (text, tag) pieces at the end of the chat in one Tk call."""
+        # While the response queue is being drained, everything it adds is
+        # collected and written with a single insert when the drain ends
+        if self._draining:
+            self._drain_pieces.extend(pieces)
+            self._chat_empty = False
+            return
         
-        if newline and self.chat_display.get(1.0, tk.END).strip():
-            self.chat_display.insert(tk.END, "\n")
+        args = []
+        for text, tag in pieces:
+            args.extend((text, tag))
         
-        # Add timestamp for new messages
-        if newline and tag in ["user", "assistant", "system", "error"]:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.chat_display.insert(tk.END, f"[{timestamp}] ", "timestamp")
+        self.chat_display.config(state=tk.NORMAL)
+        try:
+            self.chat_display.insert(tk.END, *args)
+        finally:
+            self.chat_display.config(state=tk.DISABLED)
+        self._chat_empty = False
+        self._record_chat_pieces(pieces)
+        self._schedule_scroll()
+    
+    def _timestamp(self) -> str:
+        """Current time as HH:MM:SS, formatted at most once a second."""
+        now = int(time.time())
+        if now != self._timestamp_cache[0]:
+            self._timestamp_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._timestamp_cache[1]
+    
+    def _schedule_scroll(self):
+        """Scroll to the end once the current batch of updates is done."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.parent.after_idle(self._scroll_to_end)
+    
+    def _scroll_to_end(self):
+        """Run the scroll queued by _schedule_scroll."""
+        self._scroll_pending = False
+        self.chat_display.see(tk.END)
+    
+    def _record_chat_pieces(self, pieces):
+        """Track newly inserted pieces and trim the widget once it gets long."""
+        for text, tag in pieces:
+            self._chat_pieces.append((text, tag))
+            self._chat_lines += text.count("\n")
         
-        self.chat_display.insert(tk.END, text, tag)
+        if self._chat_lines <= MAX_CHAT_LINES:
+            return
         
-        if newline:
-            self.chat_display.insert(tk.END, "\n")
+        # Move whole lines out, oldest first, and delete them with a single
+        # call. Line indices are used because Tk counts characters outside
+        # the BMP (emoji) differently from Python.
+        removed_lines = 0
+        while self._chat_pieces:
+            text, tag = self._chat_pieces.popleft()
+            self._chat_scrollback.append((text, tag))
+            removed_lines += text.count("\n")
+            if self._chat_lines - removed_lines <= CHAT_TRIM_TO_LINES and text.endswith("\n"):
+                break
+        
+        self.chat_display.delete("1.0", f"{removed_lines + 1}.0")
+        self._chat_lines -= removed_lines
+    
+    def _on_chat_yscroll(self, first, last):
+        """Forward scrolling to the scrollbar and page history in at the top."""
+        self.chat_display.vbar.set(first, last)
+        if self._chat_scrollback and float(first) <= 0.0 and not self._paging_in:
+            self._paging_in = True
+            self.parent.after_idle(self._page_in_history)
+    
+    def _page_in_history(self):
+        """Put a page of trimmed lines back at the top of the chat display."""
+        self._paging_in = False
+        page = []
+        page_lines = 0
+        while self._chat_scrollback and page_lines < CHAT_PAGE_LINES:
+            text, tag = self._chat_scrollback.pop()
+            page.append((text, tag))
+            page_lines += text.count("\n")
+        if not page:
+            return
+        page.reverse()
         
+        args = []
+        for text, tag in page:
+            args.extend((text, tag))
+        self.chat_display.config(state=tk.NORMAL)
+        self.chat_display.insert("1.0", *args)
         self.chat_display.config(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        
+        self._chat_pieces.extendleft(reversed(page))
+        self._chat_lines += page_lines
+        # Keep the line the user was looking at in place
+        self.chat_display.yview(f"{page_lines + 1}.0")
     
     def update_button_states(self):
         """Update button states based on current status."""
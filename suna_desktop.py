@@ -17,12 +17,85 @@ import webbrowser
 from pathlib import Path
 import signal
 import psutil
-from typing import Optional, Dict, Any, List
-import requests
+from typing import Optional, Dict, Any, List, Callable
+import http.client
 import queue
 from datetime import datetime
 import secrets
 import hashlib
+from concurrent.futures import Future
+from collections import deque
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# Docker Compose command prefix, found on first use; see _compose_command
+_compose = None
+
+def _compose_command():
+    """Return the Docker Compose command prefix, or None if unavailable.
+    
+    The `docker compose` plugin is preferred: it's a Go subcommand, while the
+    legacy docker-compose wrapper may start a Python interpreter on every
+    call. Only a successful lookup is remembered, so Compose installed while
+    the app is open is still picked up.
+    """
+    global _compose
+    if _compose is None:
+        for command in (['docker', 'compose'], ['docker-compose']):
+            if shutil.which(command[0]) is None:
+                continue
+            try:
+                subprocess.run(command + ['version'], capture_output=True, check=True, timeout=10)
+            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+                continue
+            _compose = command
+            break
+    return _compose
+
+class _DaemonWorker:
+    """Runs submitted calls one at a time on a single daemon thread.
+    
+    Used instead of a ThreadPoolExecutor: pool workers are joined at exit,
+    so a docker compose run or a slow probe would keep the app alive after
+    its window is closed.
+    """
+    
+    def __init__(self, name: str):
+        self._jobs = queue.Queue()
+        threading.Thread(target=self._run, name=name, daemon=True).start()
+    
+    def submit(self, fn, *args) -> Future:
+        """Queue fn(*args) and return a Future for its result."""
+        future = Future()
+        self._jobs.put((future, fn, args))
+        return future
+    
+    def _run(self):
+        """Work through queued calls for the life of the process."""
+        while True:
+            future, fn, args = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+# Entries a Suna checkout must have, as (name, is_directory)
+REQUIRED_SUNA_ENTRIES = (
+    ('docker-compose.yaml', False),
+    ('backend', True),
+    ('frontend', True),
+)
+
+# How long docker-compose status and HTTP health results are reused
+STATUS_CACHE_SECONDS = 3.0
+HEALTH_CACHE_SECONDS = 2.0
 
 class SunaService:
     """Manages the Suna backend services."""
@@ -33,9 +106,22 @@ class SunaService:
         self.is_running = False
         self.web_port = 3000
         self.api_port = 8000
+        self._health_worker = _DaemonWorker("suna-health")
+        # Recent status/health results, {key: (time.monotonic(), result)}
+        self._status_cache = {}
+        self._requirements_met = False
+        
+        # Idle keep-alive connections for the health probes, by port, so the
+        # connections to the frontend and backend stay open between polls
+        self._http_connections = {}
         
     def check_requirements(self) -> tuple[bool, str]:
         """Check if all requirements are met to run Suna."""
+        # Once everything has been found there's no need to probe again;
+        # failures are re-checked so fixing the setup is noticed
+        if self._requirements_met:
+            return True, "All requirements met"
+        
         # Security: Validate suna_path is within reasonable bounds
         try:
             resolved_path = self.suna_path.resolve()
@@ -52,20 +138,23 @@ class SunaService:
         except subprocess.TimeoutExpired:
             return False, "Docker command timed out"
         
-        # Check if docker-compose is available
-        try:
-            subprocess.run(['docker-compose', '--version'], capture_output=True, check=True, timeout=10)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Check if Docker Compose is available
+        if _compose_command() is None:
             return False, "Docker Compose is not installed or not available"
-        except subprocess.TimeoutExpired:
-            return False, "Docker Compose command timed out"
         
-        # Check if Suna directory exists and has necessary files
-        required_files = ['docker-compose.yaml', 'backend/', 'frontend/']
-        for file in required_files:
-            if not (self.suna_path / file).exists():
-                return False, f"Required file/directory missing: {file}"
+        # Check if Suna directory exists and has necessary files, reading
+        # the directory once rather than stat()ing each entry
+        try:
+            with os.scandir(self.suna_path) as entries:
+                found = {entry.name: entry.is_dir() for entry in entries}
+        except OSError as e:
+            return False, f"Invalid Suna path: {e}"
+        missing = [name + "/" if is_dir else name
+                   for name, is_dir in REQUIRED_SUNA_ENTRIES if found.get(name) != is_dir]
+        if missing:
+            return False, f"Required file/directory missing: {', '.join(missing)}"
         
+        self._requirements_met = True
         return True, "All requirements met"
     
     def setup_environment(self) -> tuple[bool, str]:
@@ -121,34 +210,82 @@ NEXT_PUBLIC_FRONTEND_URL=http://localhost:3000
         except Exception as e:
             return False, f"Failed to setup environment: {str(e)}"
     
-    def start_services(self) -> tuple[bool, str]:
-        """Start all Suna services using Docker Compose."""
+    def _cached(self, key: str, ttl: float):
+        """Return the result stored under key if it is younger than ttl."""
+        entry = self._status_cache.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+    
+    def start_services(self, on_output: Optional[Callable[[str], None]] = None) -> tuple[bool, str]:
+        """Start all Suna services using Docker Compose.
+        
+        Each line compose prints is passed to on_output as it arrives, so a
+        first start that pulls images shows its progress instead of nothing.
+        """
         if self.is_running:
             return False, "Services are already running"
         
+        compose = _compose_command()
+        if compose is None:
+            return False, "Docker Compose is not installed or not available"
+        
         try:
-            # Change to Suna directory
-            os.chdir(self.suna_path)
-            
-            # Start services with docker-compose
+            # Start services with Docker Compose; cwd= instead of os.chdir so
+            # the rest of the app keeps its working directory
             process = subprocess.Popen(
-                ['docker-compose', 'up', '-d'],
+                compose + ['up', '-d'],
+                cwd=self.suna_path,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300  # 5 minute timeout
+                encoding='utf-8',
+                errors='replace',
+                # Own process group, so a timeout also kills anything a
+                # docker-compose wrapper script started
+                start_new_session=(os.name != 'nt')
             )
             
-            stdout, stderr = process.communicate()
+            def kill():
+                try:
+                    if os.name != 'nt':
+                        os.killpg(process.pid, signal.SIGKILL)
+                    else:
+                        process.kill()
+                except OSError:
+                    pass  # Already exited
             
-            if process.returncode == 0:
+            # Reading the pipe blocks, so the 5 minute limit is enforced by
+            # killing compose, which ends the read loop below
+            timer = threading.Timer(300, kill)
+            timer.daemon = True
+            timer.start()
+            # Only the tail is kept, for the error message
+            tail = deque(maxlen=20)
+            try:
+                for line in process.stdout:
+                    line = line.rstrip()
+                    if not line:
+                        continue
+                    tail.append(line)
+                    if on_output:
+                        on_output(line)
+                returncode = process.wait()
+            finally:
+                timed_out = not timer.is_alive()
+                timer.cancel()
+                process.stdout.close()
+            
+            self._status_cache.clear()
+            if timed_out:
+                return False, "Service startup timed out"
+            if returncode == 0:
                 self.is_running = True
                 return True, "Services started successfully"
             else:
-                return False, f"Failed to start services: {stderr}"
+                output = '\n'.join(tail)
+                return False, f"Failed to start services: {output}"
         
-        except subprocess.TimeoutExpired:
-            return False, "Service startup timed out"
         except Exception as e:
             return False, f"Error starting services: {str(e)}"
     
@@ -157,25 +294,26 @@ NEXT_PUBLIC_FRONTEND_URL=http://localhost:3000
         if not self.is_running:
             return False, "Services are not running"
         
+        compose = _compose_command()
+        if compose is None:
+            return False, "Docker Compose is not installed or not available"
+        
         try:
-            os.chdir(self.suna_path)
-            
             # Stop services
-            process = subprocess.Popen(
-                ['docker-compose', 'down'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            process = subprocess.run(
+                compose + ['down'],
+                cwd=self.suna_path,
+                capture_output=True,
                 text=True,
                 timeout=120  # 2 minute timeout
             )
             
-            stdout, stderr = process.communicate()
-            
+            self._status_cache.clear()
             if process.returncode == 0:
                 self.is_running = False
                 return True, "Services stopped successfully"
             else:
-                return False, f"Failed to stop services: {stderr}"
+                return False, f"Failed to stop services: {process.stderr}"
         
         except subprocess.TimeoutExpired:
             return False, "Service shutdown timed out"
@@ -184,23 +322,36 @@ NEXT_PUBLIC_FRONTEND_URL=http://localhost:3000
     
     def get_service_status(self) -> Dict[str, Any]:
         """Get the status of all services."""
+        # Every call forks the Docker CLI, so repeated polls reuse the last
+        # answer for a few seconds
+        cached = self._cached("ps", STATUS_CACHE_SECONDS)
+        if cached is not None:
+            return cached
+        
+        status = self._read_service_status()
+        self._status_cache["ps"] = (time.monotonic(), status)
+        return status
+    
+    def _read_service_status(self) -> Dict[str, Any]:
+        """Ask Docker Compose for the state of each service."""
+        compose = _compose_command()
+        if compose is None:
+            return {"status": "error", "message": "Docker Compose is not installed or not available"}
+        
         try:
-            os.chdir(self.suna_path)
+            # Output stays as bytes; both parsers take them directly
             process = subprocess.run(
-                ['docker-compose', 'ps', '--format', 'json'],
+                compose + ['ps', '--format', 'json'],
+                cwd=self.suna_path,
                 capture_output=True,
-                text=True,
                 timeout=30
             )
             
             if process.returncode == 0:
-                services = []
-                for line in process.stdout.strip().split('\n'):
-                    if line:
-                        services.append(json.loads(line))
+                services = [_json_loads(line) for line in process.stdout.splitlines() if line.strip()]
                 return {"status": "success", "services": services}
             else:
-                return {"status": "error", "message": process.stderr}
+                return {"status": "error", "message": process.stderr.decode('utf-8', errors='replace')}
         
         except subprocess.TimeoutExpired:
             return {"status": "error", "message": "Status check timed out"}
@@ -209,6 +360,10 @@ NEXT_PUBLIC_FRONTEND_URL=http://localhost:3000
     
     def check_health(self) -> Dict[str, bool]:
         """Check health of individual services."""
+        cached = self._cached("health", HEALTH_CACHE_SECONDS)
+        if cached is not None:
+            return dict(cached)
+        
         health = {
             "frontend": False,
             "backend": False,
@@ -216,27 +371,11 @@ NEXT_PUBLIC_FRONTEND_URL=http://localhost:3000
             "rabbitmq": False
         }
         
-        # Check frontend
-        try:
-            response = requests.get(
-                f"http://localhost:{self.web_port}", 
-                timeout=5,
-                headers={'User-Agent': 'SunaDesktop/1.0'}
-            )
-            health["frontend"] = response.status_code == 200
-        except Exception:
-            pass
-        
-        # Check backend
-        try:
-            response = requests.get(
-                f"http://localhost:{self.api_port}/api/health", 
-                timeout=5,
-                headers={'User-Agent': 'SunaDesktop/1.0'}
-            )
-            health["backend"] = response.status_code == 200
-        except Exception:
-            pass
+        # Probe frontend and backend side by side, so a service that is
+        # down doesn't hold up the other check for the whole timeout
+        frontend = self._health_worker.submit(self._probe, self.web_port, "/")
+        health["backend"] = self._probe(self.api_port, "/api/health")
+        health["frontend"] = frontend.result()
         
         # Note: Redis and RabbitMQ health would need docker inspection
         # For simplicity, we'll mark them as healthy if backend is healthy
@@ -244,7 +383,34 @@ NEXT_PUBLIC_FRONTEND_URL=http://localhost:3000
             health["redis"] = True
             health["rabbitmq"] = True
         
-        return health
+        self._status_cache["health"] = (time.monotonic(), health)
+        return dict(health)
+    
+    def _probe(self, port: int, path: str) -> bool:
+        """Return whether localhost:port answers path with HTTP 200."""
+        # A plain http.client request is plenty for a local health check.
+        # A kept connection the server has since closed fails straight
+        # away, so that case gets one retry on a fresh connection.
+        connection = self._http_connections.pop(port, None)
+        for reused in (connection is not None, False):
+            if not reused:
+                # Local services answer well within this; anything slower
+                # is reported as down rather than stalling the status poll
+                connection = http.client.HTTPConnection('localhost', port, timeout=2)
+            try:
+                connection.request('GET', path, headers={'User-Agent': 'SunaDesktop/1.0'})
+                response = connection.getresponse()
+                response.read()
+            except Exception:
+                connection.close()
+                if reused:
+                    continue
+                return False
+
+            if not response.will_close:
+                self._http_connections[port] = connection
+            return response.status == 200
+        return False
 
 class SunaDesktopGUI:
     """Main GUI application for Suna Desktop."""
@@ -257,13 +423,26 @@ class SunaDesktopGUI:
         # Initialize service manager
         self.suna_service = None
         self.suna_path = None
+        # Workers queue messages and wake the Tk thread with a virtual event
         self.status_queue = queue.Queue()
+        self._notify_lock = threading.Lock()
+        self._notify_pending = False
+        
+        # docker-compose runs one at a time on a single long-lived worker, so
+        # a Start clicked during a Restart queues up instead of racing it
+        self.service_executor = _DaemonWorker("suna-service")
+        # Health checks get their own worker so they keep running while a
+        # long docker-compose command is in progress
+        self.health_executor = _DaemonWorker("suna-health-poll")
+        self._health_pending = False
         
         # GUI state
         self.is_setup = False
         
         self.setup_gui()
-        self.root.after(1000, self.update_status)
+        self.root.bind("<<SunaStatus>>", lambda e: self.drain_queue())
+        self.root.after(1000, self._queue_watchdog)
+        self.root.after(1000, self.poll_health)
     
     def setup_gui(self):
         """Set up the main GUI interface."""
@@ -461,20 +640,42 @@ class SunaDesktopGUI:
     
     def download_suna(self):
         """Download Suna from GitHub."""
+        # Dialogs have to run on the Tk thread, so ask before handing off
+        target_dir = filedialog.askdirectory(title="Select Download Location")
+        if not target_dir:
+            return
+        suna_dir = os.path.join(target_dir, "suna")
+        
         def download_worker():
             try:
-                import git
-                target_dir = filedialog.askdirectory(title="Select Download Location")
-                if target_dir:
-                    suna_dir = os.path.join(target_dir, "suna")
-                    self.status_queue.put(("info", "Downloading Suna from GitHub..."))
-                    git.Repo.clone_from("https://github.com/kortix-ai/suna.git", suna_dir)
-                    self.status_queue.put(("success", f"Suna downloaded to {suna_dir}"))
-                    self.path_var.set(suna_dir)
-            except ImportError:
-                self.status_queue.put(("error", "GitPython not installed. Please install with: pip install gitpython"))
+                self._post_status("info", "Downloading Suna from GitHub...")
+                # Only the latest commit of the default branch is needed
+                process = subprocess.Popen(
+                    ['git', 'clone', '--progress', '--depth=1', '--single-branch',
+                     'https://github.com/kortix-ai/suna.git', suna_dir],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace'
+                )
+                
+                # git redraws its progress lines with \r, which text mode
+                # also splits on; only the finished steps are logged
+                for line in process.stderr:
+                    line = line.strip()
+                    if line and ('%' not in line or line.endswith('done.')):
+                        self._post_status("info", line)
+                
+                if process.wait() == 0:
+                    self._post_status("success", f"Suna downloaded to {suna_dir}")
+                    self._post_status("set_path", suna_dir)
+                else:
+                    self._post_status("error", f"Download failed: git exited with code {process.returncode}")
+            except FileNotFoundError:
+                self._post_status("error", "Git is not installed or not available")
             except Exception as e:
-                self.status_queue.put(("error", f"Download failed: {str(e)}"))
+                self._post_status("error", f"Download failed: {str(e)}")
         
         threading.Thread(target=download_worker, daemon=True).start()
     
@@ -485,7 +686,9 @@ class SunaDesktopGUI:
             self.append_to_logs("Please select Suna directory first", "error")
             return
         
-        self.suna_service = SunaService(path)
+        # Keep the service for the same directory, along with its state
+        if self.suna_service is None or self.suna_service.suna_path != Path(path):
+            self.suna_service = SunaService(path)
         success, message = self.suna_service.check_requirements()
         
         self.append_to_logs(f"Requirements check: {message}", 
@@ -527,15 +730,16 @@ class SunaDesktopGUI:
             return
         
         def start_worker():
-            self.status_queue.put(("info", "Starting Suna services..."))
-            success, message = self.suna_service.start_services()
-            self.status_queue.put(("success" if success else "error", message))
+            self._post_status("info", "Starting Suna services...")
+            success, message = self.suna_service.start_services(
+                lambda line: self._post_status("info", line))
+            self._post_status("success" if success else "error", message)
             
             if success:
-                self.status_queue.put(("enable_stop", None))
-                self.status_queue.put(("disable_start", None))
+                self._post_status("enable_stop", None)
+                self._post_status("disable_start", None)
         
-        threading.Thread(target=start_worker, daemon=True).start()
+        self.service_executor.submit(start_worker)
     
     def stop_services(self):
         """Stop Suna services."""
@@ -543,31 +747,32 @@ class SunaDesktopGUI:
             return
         
         def stop_worker():
-            self.status_queue.put(("info", "Stopping Suna services..."))
+            self._post_status("info", "Stopping Suna services...")
             success, message = self.suna_service.stop_services()
-            self.status_queue.put(("success" if success else "error", message))
+            self._post_status("success" if success else "error", message)
             
             if success:
-                self.status_queue.put(("enable_start", None))
-                self.status_queue.put(("disable_stop", None))
+                self._post_status("enable_start", None)
+                self._post_status("disable_stop", None)
         
-        threading.Thread(target=stop_worker, daemon=True).start()
+        self.service_executor.submit(stop_worker)
     
     def restart_services(self):
         """Restart Suna services."""
         def restart_worker():
             # Stop first
             if self.suna_service.is_running:
-                self.status_queue.put(("info", "Stopping services..."))
+                self._post_status("info", "Stopping services...")
                 self.suna_service.stop_services()
                 time.sleep(2)
             
             # Then start
-            self.status_queue.put(("info", "Starting services..."))
-            success, message = self.suna_service.start_services()
-            self.status_queue.put(("success" if success else "error", message))
+            self._post_status("info", "Starting services...")
+            success, message = self.suna_service.start_services(
+                lambda line: self._post_status("info", line))
+            self._post_status("success" if success else "error", message)
         
-        threading.Thread(target=restart_worker, daemon=True).start()
+        self.service_executor.submit(restart_worker)
     
     def open_web_interface(self):
         """Open the web interface in browser."""
@@ -614,6 +819,10 @@ class SunaDesktopGUI:
     
     def append_to_logs(self, message: str, level: str = "info"):
         """Append message to logs."""
+        self._write_logs([message])
+    
+    def _write_logs(self, messages: List[str]):
+        """Append several log messages with one insert and one scroll."""
         timestamp = datetime.now().strftime("%H:%M:%S")
         
         # Determine color based on level
@@ -622,22 +831,55 @@ class SunaDesktopGUI:
         else:
             text_widget = self.logs_text
         
-        text_widget.config(state=tk.NORMAL)
         # Security: Limit log message length
-        safe_message = message[:1000] if len(message) > 1000 else message
-        text_widget.insert(tk.END, f"[{timestamp}] {safe_message}\n")
+        lines = "".join(f"[{timestamp}] {message[:1000]}\n" for message in messages)
+        
+        text_widget.config(state=tk.NORMAL)
+        text_widget.insert(tk.END, lines)
         text_widget.see(tk.END)
         text_widget.config(state=tk.DISABLED)
     
-    def update_status(self):
-        """Update service status and handle queued messages."""
-        # Handle status queue
+    def _health_worker(self, service: SunaService):
+        """Check service health off the Tk thread and queue the result."""
+        health = {}
+        try:
+            health = service.check_health()
+        finally:
+            self._post_status("health", health)
+    
+    def _post_status(self, msg_type: str, content: Any):
+        """Queue a message for the Tk thread and wake it to handle it."""
+        self.status_queue.put((msg_type, content))
+        
+        # One wake-up per drain is enough
+        with self._notify_lock:
+            if self._notify_pending:
+                return
+            self._notify_pending = True
+        try:
+            self.root.event_generate("<<SunaStatus>>", when="tail")
+        except (RuntimeError, tk.TclError):
+            # Main loop not running (yet); the watchdog picks this up
+            pass
+    
+    def _queue_watchdog(self):
+        """Drain the queue now and then in case a wake-up was missed."""
+        self.drain_queue()
+        self.root.after(1000, self._queue_watchdog)
+    
+    def drain_queue(self):
+        """Handle queued messages from the worker threads."""
+        with self._notify_lock:
+            self._notify_pending = False
+        
+        # Log lines from the whole drain go into the widget in one go
+        log_messages = []
         try:
             while True:
                 msg_type, content = self.status_queue.get_nowait()
                 
                 if msg_type in ["info", "success", "error"]:
-                    self.append_to_logs(content, msg_type)
+                    log_messages.append(content)
                 elif msg_type == "enable_stop":
                     self.stop_btn.config(state=tk.NORMAL)
                     self.restart_btn.config(state=tk.NORMAL)
@@ -648,18 +890,29 @@ class SunaDesktopGUI:
                     self.start_btn.config(state=tk.NORMAL)
                 elif msg_type == "disable_start":
                     self.start_btn.config(state=tk.DISABLED)
+                elif msg_type == "set_path":
+                    self.path_var.set(content)
+                elif msg_type == "health":
+                    self._health_pending = False
+                    for service, is_healthy in content.items():
+                        if service in self.status_vars:
+                            self.status_vars[service].set("🟢" if is_healthy else "🔴")
         except queue.Empty:
             pass
         
-        # Update service status indicators
-        if self.suna_service and self.is_setup:
-            health = self.suna_service.check_health()
-            for service, is_healthy in health.items():
-                if service in self.status_vars:
-                    self.status_vars[service].set("🟢" if is_healthy else "🔴")
-        
-        # Schedule next update
-        self.root.after(5000, self.update_status)
+        if log_messages:
+            self._write_logs(log_messages)
+    
+    def poll_health(self):
+        """Refresh the service status indicators every few seconds."""
+        # The probes run on a worker and report back through the queue, so
+        # a slow service can't freeze the window; a new check starts only
+        # once the previous one has answered.
+        if self.suna_service and self.is_setup and not self._health_pending:
+            self._health_pending = True
+            self.health_executor.submit(self._health_worker, self.suna_service)
+        
+        self.root.after(5000, self.poll_health)
 
 def main():
     """Main function to run the Suna Desktop application."""
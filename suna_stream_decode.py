@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Decoder for Suna's NDJSON agent response stream.
+
+Kept apart from suna_chat so the hot loop can be compiled on its own.
+It is plain, fully annotated Python, and either of
+
+    cythonize -i suna_stream_decode.py
+    mypyc suna_stream_decode.py
+
+builds an extension module next to it. Python imports that in
+preference to this file; without it the pure-Python version is used.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Most stream lines are plain text deltas in exactly this shape
+_DELTA_PREFIX = b'{"type":"delta","delta":{"content":"'
+_DELTA_SUFFIX = b'"}}'
+
+
+def _loads_with_delta_shortcut(line: Union[bytes, bytearray]) -> Any:
+    """json.loads, slicing the text straight out of simple delta lines."""
+    if line.startswith(_DELTA_PREFIX) and line.endswith(_DELTA_SUFFIX):
+        content = line[len(_DELTA_PREFIX):-len(_DELTA_SUFFIX)]
+        # Anything escaped (or an extra key) goes through the real parser
+        if b'\\' not in content and b'"' not in content:
+            return {"type": "delta", "delta": {"content": content.decode('utf-8')}}
+    return json.loads(line)
+
+
+# orjson parses a delta line faster than the shortcut can slice one, so the
+# shortcut only stands in for the stdlib parser
+_json_loads = orjson.loads if orjson is not None else _loads_with_delta_shortcut
+
+
+def decode_line(line: Union[bytes, bytearray]) -> Any:
+    """Decode one stream line; None for blank lines."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        return _json_loads(line)
+    except ValueError:
+        # orjson's decode error is a ValueError as well
+        return {"type": "raw", "content": line.decode('utf-8', errors='replace')}
+
+
+def decode_stream(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """Yield the decoded events of a stream given its raw body chunks."""
+    # Split lines out of the raw chunks ourselves rather than going through
+    # a line iterator that reads in small pieces. Lines are sliced from a
+    # moving start offset, and the consumed part of the buffer is dropped
+    # once per chunk rather than once per line. Both parsers take the
+    # bytearray slice as it is, so it isn't copied again into bytes.
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        newline = buffer.find(b"\n")
+        while newline >= 0:
+            data = decode_line(buffer[start:newline])
+            if data is not None:
+                yield data
+            start = newline + 1
+            newline = buffer.find(b"\n", start)
+        if start:
+            del buffer[:start]
+
+    data = decode_line(buffer)
+    if data is not None:
+        yield data